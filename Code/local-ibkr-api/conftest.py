@@ -0,0 +1,82 @@
+"""
+Shared fixtures for the IB Gateway smoke tests in this directory.
+
+Every test here is marked ``integration``, which is deselected by default;
+run them with ``pytest -m integration``. Tests that need a live
+session are skipped by the ``needs_ib`` probe unless ib_insync is installed
+and the Gateway at IB_GATEWAY_HOST:IB_GATEWAY_PORT (default 127.0.0.1:4002,
+the paper-trading port) accepts connections.
+"""
+import asyncio
+import importlib.util
+import os
+import socket
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: requires IB Gateway")
+    # Same as -m "not integration"; an explicit -m replaces it
+    if not config.option.markexpr:
+        config.option.markexpr = "not integration"
+
+
+def _gateway_address() -> tuple[str, int]:
+    return (
+        os.environ.get("IB_GATEWAY_HOST", "127.0.0.1"),
+        int(os.environ.get("IB_GATEWAY_PORT", "4002")),
+    )
+
+
+class _LazyIBProbe:
+    """
+    Truthy when ib_insync is installed and the Gateway port accepts TCP.
+
+    The check runs on first use and is cached for the rest of the session.
+    """
+
+    def __bool__(self) -> bool:
+        if not hasattr(self, "_available"):
+            self._available = self._probe()
+        return self._available
+
+    @staticmethod
+    def _probe() -> bool:
+        if importlib.util.find_spec("ib_insync") is None:
+            return False
+        # A refused connection fails in microseconds; don't wait on the API timeout
+        try:
+            with socket.create_connection(_gateway_address(), timeout=0.25):
+                return True
+        except OSError:
+            return False
+
+
+IB_AVAILABLE = _LazyIBProbe()
+
+
+@pytest.fixture(scope="session")
+def ib_available():
+    return IB_AVAILABLE
+
+
+@pytest.fixture(scope="session")
+def needs_ib(ib_available):
+    """Skip the requesting test unless ib_insync and the Gateway are usable."""
+    if not ib_available:
+        host, port = _gateway_address()
+        pytest.skip(f"ib_insync missing or IB Gateway not listening on {host}:{port}")
+
+
+@pytest.fixture(scope="session")
+def ib_client(needs_ib):
+    """One connected IB session shared by every Gateway smoke test."""
+    # Imported here so collecting these modules never loads ib_insync
+    import ib_insync
+
+    host, port = _gateway_address()
+    ib = ib_insync.IB()
+    ib.run(asyncio.wait_for(ib.connectAsync(host, port, clientId=998), timeout=2.0))
+    yield ib
+    ib.disconnect()
@@ -1,4 +1,6 @@
 """Configuration settings for the trading API."""
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -14,6 +16,7 @@ class Settings(BaseSettings):
     
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
+    REDIS_POOL_SIZE: int = 32  # Max pooled connections per worker
     
     # IB Gateway
     IB_GATEWAY_HOST: str = "stocks-ib-gateway"
@@ -31,16 +34,30 @@ class Settings(BaseSettings):
     # Conditional Order Check Settings
     CONDITIONAL_CHECK_PRICE_WAIT: int = 2  # seconds to wait for price data
     
+    # Logging
+    LOG_STACK_TRACES: bool = False  # Include stack traces in unhandled-error logs
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings (parsed and validated once per process)."""
     return Settings()
 
 
+async def get_config() -> Settings:
+    """
+    FastAPI dependency provider for application settings.
+    
+    Declared async so FastAPI awaits it directly instead of running it in
+    the threadpool; it only returns the cached settings.
+    """
+    return get_settings()
+
+
 # Export market data settings for easy import
 settings = get_settings()
 MARKET_DATA_TYPE = settings.MARKET_DATA_TYPE
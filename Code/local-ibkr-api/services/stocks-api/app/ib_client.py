@@ -18,15 +18,11 @@ from app.utils.exceptions import (
     IBKRMarketDataError,
     IBKRAuthenticationError
 )
+from app.utils.metrics import set_connection_status
 
 logger = structlog.get_logger(__name__)
 
 # Prometheus metrics
-ib_connection_status = Gauge(
-    'ib_connection_status',
-    'IB Gateway connection status (1=connected, 0=disconnected)',
-    ['container']
-)
 ib_orders_total = Counter(
     'ib_orders_total',
     'Total orders submitted to IBKR',
@@ -218,7 +214,7 @@ class IBKRClient:
                 # Verify connection
                 if self.ib.isConnected():
                     self.connected = True
-                    ib_connection_status.labels(container=self.container_name).set(1)
+                    set_connection_status("ib", True, instance=self.container_name)
 
                     # Set up event handlers
                     self.ib.errorEvent += self._on_error
@@ -246,7 +242,7 @@ class IBKRClient:
                 if attempt < self.max_retries:
                     await asyncio.sleep(self.retry_delay * attempt)
                 else:
-                    ib_connection_status.labels(container=self.container_name).set(0)
+                    set_connection_status("ib", False, instance=self.container_name)
                     raise IBKRConnectionError(
                         f"Failed to connect to IB Gateway at {self.host}:{self.port} "
                         f"after {self.max_retries} attempts"
@@ -262,7 +258,7 @@ class IBKRClient:
                 if attempt < self.max_retries:
                     await asyncio.sleep(self.retry_delay * attempt)
                 else:
-                    ib_connection_status.labels(container=self.container_name).set(0)
+                    set_connection_status("ib", False, instance=self.container_name)
                     raise IBKRConnectionError(f"Connection failed: {str(e)}") from e
 
         return False
@@ -274,7 +270,7 @@ class IBKRClient:
                 logger.info("ibkr_disconnecting", host=self.host, port=self.port)
                 self.ib.disconnect()
                 self.connected = False
-                ib_connection_status.labels(container=self.container_name).set(0)
+                set_connection_status("ib", False, instance=self.container_name)
                 logger.info("ibkr_disconnected")
             except Exception as e:
                 logger.error("ibkr_disconnect_error", error=str(e))
@@ -289,7 +285,7 @@ class IBKRClient:
         """
         is_conn = self.ib is not None and self.ib.isConnected()
         self.connected = is_conn
-        ib_connection_status.labels(container=self.container_name).set(1 if is_conn else 0)
+        set_connection_status("ib", is_conn, instance=self.container_name)
         return is_conn
 
     @ib_operation_duration.labels(operation="place_order").time()
@@ -621,7 +617,7 @@ class IBKRClient:
     def _on_disconnected(self):
         """Handle disconnection events."""
         self.connected = False
-        ib_connection_status.labels(container=self.container_name).set(0)
+        set_connection_status("ib", False, instance=self.container_name)
         logger.warning("ibkr_disconnected_event", host=self.host, port=self.port)
 
     def _on_order_status(self, trade):
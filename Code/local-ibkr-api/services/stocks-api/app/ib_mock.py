@@ -32,6 +32,17 @@ from app.utils.exceptions import (
 
 logger = structlog.get_logger(__name__)
 
+# Base mock prices by symbol (for consistency in tests)
+_BASE_PRICES: dict[str, float] = {
+    "AAPL": 175.0,
+    "MSFT": 380.0,
+    "GOOGL": 140.0,
+    "AMZN": 155.0,
+    "TSLA": 245.0,
+    "SPY": 455.0,
+    "QQQ": 385.0,
+}
+
 
 class MockIBKRClient:
     """
@@ -41,6 +52,10 @@ class MockIBKRClient:
     requiring actual IB Gateway connection.
     """
 
+    # Multiplier applied to simulated delays; tests set it to 0 on the class
+    # so simulate_delays keeps its meaning without costing wall-clock time
+    delay_scale: float = 1.0
+
     def __init__(
         self,
         host: str = "mock-gateway",
@@ -86,7 +101,7 @@ class MockIBKRClient:
     async def connect(self) -> bool:
         """Mock connect - always succeeds."""
         if self.simulate_delays:
-            await asyncio.sleep(0.1)  # Simulate connection delay
+            await asyncio.sleep(0.1 * self.delay_scale)  # Simulate connection delay
 
         self.connected = True
         logger.info("mock_ibkr_connected", host=self.host, port=self.port)
@@ -124,7 +139,7 @@ class MockIBKRClient:
             raise IBKROrderError("Order quantity must be positive")
 
         if self.simulate_delays:
-            await asyncio.sleep(0.05)  # Simulate order processing
+            await asyncio.sleep(0.05 * self.delay_scale)  # Simulate order processing
 
         # Create mock trade
         order_id = self._next_order_id
@@ -198,7 +213,7 @@ class MockIBKRClient:
             raise IBKRConnectionError("Mock client not connected")
 
         if self.simulate_delays:
-            await asyncio.sleep(0.02)
+            await asyncio.sleep(0.02 * self.delay_scale)
 
         return self._positions
 
@@ -208,7 +223,7 @@ class MockIBKRClient:
             raise IBKRConnectionError("Mock client not connected")
 
         if self.simulate_delays:
-            await asyncio.sleep(0.02)
+            await asyncio.sleep(0.02 * self.delay_scale)
 
         return self._portfolio_items
 
@@ -218,7 +233,7 @@ class MockIBKRClient:
             raise IBKRConnectionError("Mock client not connected")
 
         if self.simulate_delays:
-            await asyncio.sleep(0.02)
+            await asyncio.sleep(0.02 * self.delay_scale)
 
         return self._account_summary.copy()
 
@@ -300,7 +315,7 @@ class MockIBKRClient:
             contract: The contract being traded
         """
         # Simulate a short delay
-        await asyncio.sleep(0.1 if self.simulate_delays else 0.0)
+        await asyncio.sleep(0.1 * self.delay_scale if self.simulate_delays else 0.0)
 
         # Create mock execution
         execution = Execution(
@@ -363,18 +378,7 @@ class MockIBKRClient:
         Returns:
             float: Mock price
         """
-        # Generate prices based on symbol (for consistency in tests)
-        base_prices = {
-            "AAPL": 175.0,
-            "MSFT": 380.0,
-            "GOOGL": 140.0,
-            "AMZN": 155.0,
-            "TSLA": 245.0,
-            "SPY": 455.0,
-            "QQQ": 385.0,
-        }
-
-        base_price = base_prices.get(contract.symbol, 100.0)
+        base_price = _BASE_PRICES.get(contract.symbol, 100.0)
         # Add small random variation
         variation = random.uniform(-2.0, 2.0)
         return round(base_price + variation, 2)
@@ -1,23 +1,37 @@
 """Main FastAPI application."""
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import asyncio
+import logging
+import sys
 import structlog
 from app.services.threaded_monitor import ThreadedConditionalMonitor
 from app.config import get_settings
 from app.routers import health, orders, positions, accounts, bulk_orders, conditional_orders
 from app.utils.redis_client import redis_client
 from app.utils.ib_dependencies import startup_ib_client, shutdown_ib_client
+from app.utils.metrics import (
+    get_metrics,
+    start_metrics_flusher,
+    stop_metrics_flusher,
+    warmup_metrics,
+)
+from app.utils.logging import start_log_queue, stop_log_queue
+from app.utils.exceptions import ErrorResponse, register_exception_handlers
 
-# Configure structured logging
+# Configure structured logging (rendered by structlog, written via stdlib so
+# output can be moved off the request path by start_log_queue)
+logging.basicConfig(format="%(message)s", stream=sys.stdout, level=logging.INFO)
 structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
         structlog.processors.JSONRenderer()
     ],
-    logger_factory=structlog.PrintLoggerFactory(),
+    logger_factory=structlog.stdlib.LoggerFactory(),
 )
 
 logger = structlog.get_logger(__name__)
@@ -27,7 +41,11 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    start_log_queue()
     logger.info("application_starting", environment=settings.ENVIRONMENT)
+    # Start buffered metrics flusher and pre-create request metric children
+    start_metrics_flusher()
+    warmup_metrics(app)
     # Connect to Redis
     try:
         await redis_client.connect()
@@ -49,14 +67,24 @@ async def lifespan(app: FastAPI):
         await shutdown_ib_client()
     except Exception as e:
         logger.error("ib_client_shutdown_failed", error=str(e))
+    await stop_metrics_flusher()
+    stop_log_queue()
 
 app = FastAPI(
     title="IBKR Local API",
     description="Local IBKR API Integration for Paper Trading",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    # Error bodies produced by the handlers registered below
+    responses={
+        422: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+    }
 )
 
+register_exception_handlers(app)
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -66,6 +94,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses >= 1KB; outermost so every response, including CORS
+# preflight and error responses, is compressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(orders.router)
@@ -93,9 +125,17 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request) -> Response:
+    """Prometheus scrape endpoint (text or OpenMetrics, per the Accept header)."""
+    payload, content_type = get_metrics(request.headers.get("accept"))
+    # GZipMiddleware compresses the payload when the scraper accepts gzip
+    return Response(content=payload, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop")
 
 
 
@@ -11,6 +11,7 @@ from sqlalchemy.schema import FetchedValue
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.sql import func
 import enum
+import operator
 
 Base = declarative_base()
 
@@ -318,3 +319,25 @@ class ConditionalOrder(Base):
     # Tracking
     last_checked_price = Column(Numeric(precision=10, scale=2), nullable=True)
     last_checked_at = Column(DateTime, nullable=True)
+
+
+# Condition type -> comparison of (current_price, condition_price), shared by
+# both conditional order monitors
+CONDITION_COMPARATORS = {"PRICE_ABOVE": operator.ge, "PRICE_BELOW": operator.le}
+
+# Columns the monitors need to evaluate and execute a conditional order
+MONITOR_COLUMNS = (
+    ConditionalOrder.id,
+    ConditionalOrder.condition_type,
+    ConditionalOrder.condition_symbol,
+    ConditionalOrder.condition_price,
+    ConditionalOrder.last_checked_price,
+    ConditionalOrder.order_symbol,
+    ConditionalOrder.order_action,
+    ConditionalOrder.order_type,
+    ConditionalOrder.order_quantity,
+    ConditionalOrder.order_limit_price,
+    ConditionalOrder.time_in_force,
+    ConditionalOrder.exchange,
+    ConditionalOrder.currency,
+)
@@ -5,7 +5,7 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 import structlog
 
-from app.schemas.trading import OrderRequest, OrderResponse, OrderListResponse, BracketOrderRequest, BracketOrderResponse, TrailingStopRequest, TrailingStopResponse, OrderModificationRequest, OrderModificationResponse, OCOOrderRequest, OCOOrderResponse
+from app.schemas.trading import OrderRequest, OrderResponse, OrderListResponse, BracketOrderRequest, BracketOrderResponse, TrailingStopRequest, TrailingStopResponse, OrderModificationRequest, OrderModificationResponse, OCOOrderRequest, OCOOrderResponse, LMTOrderSpec
 from app.models.trading import Order, OrderStatus, OrderType
 from app.utils.database import get_db
 from app.utils.risk import RiskManager
@@ -521,6 +521,11 @@ async def modify_order(
         raise HTTPException(500, f"Failed to modify order: {str(e)}")
 
 
+def _oco_leg_price(leg):
+    """Return the limit price or stop trigger for an OCO leg."""
+    return leg.price if isinstance(leg, LMTOrderSpec) else leg.trigger
+
+
 @router.post("/oco", response_model=OCOOrderResponse)
 async def place_oco_order(
     request: OCOOrderRequest,
@@ -547,16 +552,19 @@ async def place_oco_order(
             currency=request.currency
         )
 
+        order1_price = _oco_leg_price(request.order1)
+        order2_price = _oco_leg_price(request.order2)
+
         # Place OCO orders
         trade1, trade2, oca_group = await ib_client.place_oco_order(
             contract=contract,
             quantity=request.quantity,
             order1_action=request.order1_action,
-            order1_type=request.order1_type,
-            order1_price=float(request.order1_price),
+            order1_type=request.order1.type,
+            order1_price=float(order1_price),
             order2_action=request.order2_action,
-            order2_type=request.order2_type,
-            order2_price=float(request.order2_price),
+            order2_type=request.order2.type,
+            order2_price=float(order2_price),
             time_in_force=request.time_in_force
         )
 
@@ -565,10 +573,10 @@ async def place_oco_order(
             order_id=trade1.order.orderId,
             symbol=request.symbol,
             action=request.order1_action,
-            order_type=OrderType.LIMIT if request.order1_type == "LMT" else OrderType.STOP,
+            order_type=OrderType.LIMIT if request.order1.type == "LMT" else OrderType.STOP,
             total_quantity=request.quantity,
-            limit_price=request.order1_price if request.order1_type == "LMT" else None,
-            stop_price=request.order1_price if request.order1_type == "STP" else None,
+            limit_price=order1_price if request.order1.type == "LMT" else None,
+            stop_price=order1_price if request.order1.type == "STP" else None,
             status=OrderStatus.SUBMITTED,
             time_in_force=request.time_in_force,
             client_id=999,
@@ -586,10 +594,10 @@ async def place_oco_order(
             order_id=trade2.order.orderId,
             symbol=request.symbol,
             action=request.order2_action,
-            order_type=OrderType.LIMIT if request.order2_type == "LMT" else OrderType.STOP,
+            order_type=OrderType.LIMIT if request.order2.type == "LMT" else OrderType.STOP,
             total_quantity=request.quantity,
-            limit_price=request.order2_price if request.order2_type == "LMT" else None,
-            stop_price=request.order2_price if request.order2_type == "STP" else None,
+            limit_price=order2_price if request.order2.type == "LMT" else None,
+            stop_price=order2_price if request.order2.type == "STP" else None,
             status=OrderStatus.SUBMITTED,
             time_in_force=request.time_in_force,
             client_id=999,
@@ -3,7 +3,7 @@ Pydantic schemas for API request/response validation.
 
 Defines data validation schemas for orders, positions, accounts, and errors.
 """
-from typing import Optional, Literal, List
+from typing import Annotated, Optional, Literal, List, Union
 from datetime import datetime
 from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -525,6 +525,22 @@ class OrderModificationResponse(BaseModel):
     message: str
 
 
+class LMTOrderSpec(BaseModel):
+    """Limit leg of an OCO order."""
+    type: Literal["LMT"]
+    price: Decimal = Field(..., description="Limit price")
+
+
+class STPOrderSpec(BaseModel):
+    """Stop leg of an OCO order."""
+    type: Literal["STP"]
+    trigger: Decimal = Field(..., description="Stop trigger price")
+
+
+# Discriminated on "type" so pydantic picks the variant by tag
+OCOLegSpec = Annotated[Union[LMTOrderSpec, STPOrderSpec], Field(discriminator="type")]
+
+
 class OCOOrderRequest(BaseModel):
     """One-Cancels-Other order request (two linked orders)."""
     symbol: str = Field(..., description="Stock symbol")
@@ -532,13 +548,11 @@ class OCOOrderRequest(BaseModel):
     
     # First order (typically breakout above)
     order1_action: Literal["BUY", "SELL"] = Field(..., description="Action for first order")
-    order1_type: Literal["LMT", "STP"] = Field(..., description="Order type for first order")
-    order1_price: Decimal = Field(..., description="Trigger/limit price for first order")
+    order1: OCOLegSpec = Field(..., description="Type and price for first order")
     
     # Second order (typically breakdown below)
     order2_action: Literal["BUY", "SELL"] = Field(..., description="Action for second order")
-    order2_type: Literal["LMT", "STP"] = Field(..., description="Order type for second order")
-    order2_price: Decimal = Field(..., description="Trigger/limit price for second order")
+    order2: OCOLegSpec = Field(..., description="Type and price for second order")
     
     # Optional
     time_in_force: Literal["DAY", "GTC"] = Field("GTC", description="Time in force for both orders")
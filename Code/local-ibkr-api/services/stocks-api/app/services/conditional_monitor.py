@@ -7,10 +7,19 @@ from datetime import datetime
 from decimal import Decimal
 import structlog
 
+from sqlalchemy import case, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from ib_insync import Stock
 
-from app.models.trading import ConditionalOrder, Order, OrderStatus, OrderType
+from app.models.trading import (
+    CONDITION_COMPARATORS,
+    MONITOR_COLUMNS,
+    ConditionalOrder,
+    Order,
+    OrderStatus,
+    OrderType,
+)
 from app.utils.database import SessionLocal
 from app.ib_client import IBKRClient
 from app.config import MARKET_DATA_TYPE, CONDITIONAL_CHECK_PRICE_WAIT
@@ -57,9 +66,9 @@ class ConditionalOrderMonitor:
             # Set delayed market data
             self.ib_client.ib.reqMarketDataType(MARKET_DATA_TYPE)
             
-            # Get all active orders
-            active_orders = db.query(ConditionalOrder).filter(
-                ConditionalOrder.status == "ACTIVE"
+            # Get all active orders as plain rows (no ORM identity map)
+            active_orders = db.execute(
+                select(*MONITOR_COLUMNS).where(ConditionalOrder.status == "ACTIVE")
             ).all()
             
             if not active_orders:
@@ -67,21 +76,36 @@ class ConditionalOrderMonitor:
             
             logger.info("monitor_checking_orders", count=len(active_orders))
             
+            checked_prices: dict[int, Decimal] = {}
             for cond_order in active_orders:
                 try:
-                    await self._check_single_condition(db, cond_order)
+                    current_price = await self._check_single_condition(db, cond_order)
+                    if current_price is not None:
+                        checked_prices[cond_order.id] = current_price
                 except Exception as e:
                     logger.error(
                         "monitor_check_single_error",
                         condition_id=cond_order.id,
                         error=str(e)
                     )
+            
+            # Update last checked for every priced order in one statement
+            if checked_prices:
+                db.execute(
+                    update(ConditionalOrder)
+                    .where(ConditionalOrder.id.in_(checked_prices))
+                    .values(
+                        last_checked_price=case(checked_prices, value=ConditionalOrder.id),
+                        last_checked_at=datetime.utcnow()
+                    )
+                )
+                db.commit()
                     
         finally:
             db.close()
     
-    async def _check_single_condition(self, db: Session, cond_order: ConditionalOrder):
-        """Check a single conditional order."""
+    async def _check_single_condition(self, db: Session, cond_order: Row) -> Decimal | None:
+        """Check a single conditional order and return the price it was checked at."""
         # Get current price
         contract = Stock(
             symbol=cond_order.condition_symbol,
@@ -106,19 +130,11 @@ class ConditionalOrderMonitor:
                 current_price = Decimal(str(ticker.close))
         
         if not current_price:
-            return
-        
-        # Update last checked
-        cond_order.last_checked_price = current_price
-        cond_order.last_checked_at = datetime.utcnow()
-        db.commit()
+            return None
         
         # Check condition
-        condition_met = False
-        if cond_order.condition_type == "PRICE_ABOVE":
-            condition_met = current_price >= cond_order.condition_price
-        elif cond_order.condition_type == "PRICE_BELOW":
-            condition_met = current_price <= cond_order.condition_price
+        compare = CONDITION_COMPARATORS.get(cond_order.condition_type)
+        condition_met = compare is not None and compare(current_price, cond_order.condition_price)
         
         if condition_met:
             logger.info(
@@ -129,8 +145,10 @@ class ConditionalOrderMonitor:
                 trigger_price=str(cond_order.condition_price)
             )
             await self._execute_order(db, cond_order)
+        
+        return current_price
     
-    async def _execute_order(self, db: Session, cond_order: ConditionalOrder):
+    async def _execute_order(self, db: Session, cond_order: Row):
         """Execute order when condition is met."""
         try:
             from ib_insync import Order as IBOrder
@@ -177,9 +195,15 @@ class ConditionalOrderMonitor:
             db.add(db_order)
             
             # Update conditional order
-            cond_order.status = "TRIGGERED"
-            cond_order.triggered_at = datetime.utcnow()
-            cond_order.executed_order_id = ib_order.orderId
+            db.execute(
+                update(ConditionalOrder)
+                .where(ConditionalOrder.id == cond_order.id)
+                .values(
+                    status="TRIGGERED",
+                    triggered_at=datetime.utcnow(),
+                    executed_order_id=ib_order.orderId
+                )
+            )
             
             db.commit()
             
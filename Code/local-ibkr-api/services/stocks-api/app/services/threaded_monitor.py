@@ -5,7 +5,16 @@ import structlog
 from datetime import datetime
 from decimal import Decimal
 
-from app.models.trading import ConditionalOrder, Order, OrderStatus, OrderType
+from sqlalchemy import select, update
+
+from app.models.trading import (
+    CONDITION_COMPARATORS,
+    MONITOR_COLUMNS,
+    ConditionalOrder,
+    Order,
+    OrderStatus,
+    OrderType,
+)
 from app.utils.database import SessionLocal
 
 logger = structlog.get_logger()
@@ -51,9 +60,9 @@ class ThreadedConditionalMonitor:
         db = SessionLocal()
         
         try:
-            # Get active orders
-            active_orders = db.query(ConditionalOrder).filter(
-                ConditionalOrder.status == "ACTIVE"
+            # Get active orders as plain rows (no ORM identity map)
+            active_orders = db.execute(
+                select(*MONITOR_COLUMNS).where(ConditionalOrder.status == "ACTIVE")
             ).all()
             
             if not active_orders:
@@ -79,11 +88,8 @@ class ThreadedConditionalMonitor:
             return
             
         # Check condition
-        triggered = False
-        if order.condition_type == "PRICE_ABOVE":
-            triggered = current_price >= order.condition_price
-        elif order.condition_type == "PRICE_BELOW":
-            triggered = current_price <= order.condition_price
+        compare = CONDITION_COMPARATORS.get(order.condition_type)
+        triggered = compare is not None and compare(current_price, order.condition_price)
             
         if triggered:
             logger.info("monitor_triggered", order_id=order.id, symbol=order.condition_symbol, price=str(current_price))
@@ -139,9 +145,15 @@ class ThreadedConditionalMonitor:
             db.add(db_order)
             
             # Update conditional order
-            cond_order.status = "TRIGGERED"
-            cond_order.triggered_at = datetime.utcnow()
-            cond_order.executed_order_id = ib_order.orderId
+            db.execute(
+                update(ConditionalOrder)
+                .where(ConditionalOrder.id == cond_order.id)
+                .values(
+                    status="TRIGGERED",
+                    triggered_at=datetime.utcnow(),
+                    executed_order_id=ib_order.orderId
+                )
+            )
             
             db.commit()
             
@@ -4,20 +4,39 @@ Global Exception Handlers for FastAPI.
 Provides consistent error responses and logging for all exceptions.
 """
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.config import get_settings
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+settings = get_settings()
+
+# Map HTTP status codes to error codes
+_ERROR_CODE_MAP: dict[int, str] = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    409: "CONFLICT",
+    422: "VALIDATION_ERROR",
+    429: "RATE_LIMIT_EXCEEDED",
+    500: "INTERNAL_SERVER_ERROR",
+    502: "BAD_GATEWAY",
+    503: "SERVICE_UNAVAILABLE",
+    504: "GATEWAY_TIMEOUT",
+}
+
 
 class ErrorDetail(BaseModel):
     """Detailed error information."""
@@ -49,8 +68,8 @@ class ErrorResponse(BaseModel):
         description="Additional error details"
     )
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Error timestamp"
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Error timestamp (UTC)"
     )
     request_id: str | None = Field(
         default=None,
@@ -62,9 +81,46 @@ class ErrorResponse(BaseModel):
     )
 
 
+def _build_error_dict(
+    error_code: str,
+    message: str,
+    request_id: str | None,
+    path: str | None,
+    details: Dict[str, Any] | list[Dict[str, Any]] | None = None,
+) -> Dict[str, Any]:
+    """
+    Build an error response body matching ErrorResponse without validation.
+    
+    ErrorResponse stays the documented schema; the handlers build the body
+    directly so the error path skips model construction and dumping.
+    
+    Args:
+        error_code: Machine-readable error code
+        message: Human-readable error message
+        request_id: Request correlation ID
+        path: Request path
+        details: Additional error details
+        
+    Returns:
+        Error body, omitting unset optional fields
+    """
+    body: Dict[str, Any] = {
+        "error_code": error_code,
+        "message": message,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+    if details is not None:
+        body["details"] = details
+    if request_id is not None:
+        body["request_id"] = request_id
+    if path is not None:
+        body["path"] = path
+    return body
+
+
 def get_request_id(request: Request) -> str | None:
     """
-    Extract request ID from request state.
+    Extract request ID from the request scope.
     
     Args:
         request: FastAPI request
@@ -72,10 +128,10 @@ def get_request_id(request: Request) -> str | None:
     Returns:
         Request ID if available
     """
-    return getattr(request.state, "request_id", None)
+    return request.scope.get("request_id")
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """
     Handle HTTP exceptions.
     
@@ -88,23 +144,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     """
     request_id = get_request_id(request)
     
-    # Map HTTP status codes to error codes
-    error_code_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        409: "CONFLICT",
-        422: "VALIDATION_ERROR",
-        429: "RATE_LIMIT_EXCEEDED",
-        500: "INTERNAL_SERVER_ERROR",
-        502: "BAD_GATEWAY",
-        503: "SERVICE_UNAVAILABLE",
-        504: "GATEWAY_TIMEOUT",
-    }
-    
-    error_code = error_code_map.get(exc.status_code, "HTTP_ERROR")
+    error_code = _ERROR_CODE_MAP.get(exc.status_code, "HTTP_ERROR")
     
     logger.warning(
         "http_exception",
@@ -115,24 +155,24 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         detail=exc.detail
     )
     
-    error_response = ErrorResponse(
+    content = _build_error_dict(
         error_code=error_code,
         message=exc.detail if isinstance(exc.detail, str) else "HTTP error occurred",
-        details=exc.detail if isinstance(exc.detail, dict) else None,
         request_id=request_id,
-        path=request.url.path
+        path=request.url.path,
+        details=exc.detail if isinstance(exc.detail, dict) else None,
     )
     
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump(mode="json")
+    return ORJSONResponse(
+        content=content,
+        status_code=exc.status_code
     )
 
 
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle request validation errors.
     
@@ -145,17 +185,15 @@ async def validation_exception_handler(
     """
     request_id = get_request_id(request)
     
-    # Convert Pydantic errors to our format
-    error_details = []
-    for error in exc.errors():
-        field = ".".join(str(loc) for loc in error["loc"])
-        error_details.append(
-            ErrorDetail(
-                field=field,
-                message=error["msg"],
-                type=error["type"]
-            )
-        )
+    # Convert Pydantic errors to the ErrorDetail shape as plain dicts
+    error_details = [
+        {
+            "field": ".".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in exc.errors()
+    ]
     
     logger.warning(
         "validation_error",
@@ -164,24 +202,24 @@ async def validation_exception_handler(
         errors=len(error_details)
     )
     
-    error_response = ErrorResponse(
+    content = _build_error_dict(
         error_code="VALIDATION_ERROR",
         message="Request validation failed",
-        details=[detail.model_dump() for detail in error_details],
         request_id=request_id,
-        path=request.url.path
+        path=request.url.path,
+        details=error_details,
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=error_response.model_dump(mode="json")
+    return ORJSONResponse(
+        content=content,
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
     )
 
 
 async def database_exception_handler(
     request: Request,
     exc: SQLAlchemyError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle database exceptions.
     
@@ -202,26 +240,26 @@ async def database_exception_handler(
         error_type=type(exc).__name__
     )
     
-    error_response = ErrorResponse(
+    content = _build_error_dict(
         error_code="DATABASE_ERROR",
         message="A database error occurred",
+        request_id=request_id,
+        path=request.url.path,
         details={
             "error_type": type(exc).__name__
         },
-        request_id=request_id,
-        path=request.url.path
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json")
+    return ORJSONResponse(
+        content=content,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
 
 
 async def generic_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle all other unhandled exceptions.
     
@@ -234,8 +272,8 @@ async def generic_exception_handler(
     """
     request_id = get_request_id(request)
     
-    # Get stack trace
-    stack_trace = traceback.format_exc()
+    # Formatting the stack walks every frame, so only do it when enabled
+    extra = {"stack_trace": traceback.format_exc()} if settings.LOG_STACK_TRACES else {}
     
     logger.error(
         "unhandled_exception",
@@ -243,22 +281,22 @@ async def generic_exception_handler(
         path=request.url.path,
         error=str(exc),
         error_type=type(exc).__name__,
-        stack_trace=stack_trace
+        **extra
     )
     
-    error_response = ErrorResponse(
+    content = _build_error_dict(
         error_code="INTERNAL_SERVER_ERROR",
         message="An unexpected error occurred",
+        request_id=request_id,
+        path=request.url.path,
         details={
             "error_type": type(exc).__name__
         },
-        request_id=request_id,
-        path=request.url.path
     )
     
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.model_dump(mode="json")
+    return ORJSONResponse(
+        content=content,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
 
 
@@ -285,63 +323,36 @@ class IBKRError(Exception):
     pass
 
 
-class IBKRConnectionError(IBKRError):
-    """Exception raised when IBKR connection fails."""
-    pass
+# Backwards-compatible alias for the base IBKR exception
+IBKRException = IBKRError
 
 
-class IBKROrderError(IBKRError):
-    """Exception raised when order placement fails."""
-    pass
-
-
-class IBKRMarketDataError(IBKRError):
-    """Exception raised when market data subscription fails."""
-    pass
-
-
-class RiskLimitError(Exception):
-    """Exception raised when risk limits are breached."""
-    pass
-
-
-class CircuitBreakerError(Exception):
-    """Exception raised when circuit breaker is triggered."""
-    pass
-
-
-# IBKR-specific exceptions
-class IBKRException(Exception):
-    """Base exception for IBKR-related errors."""
-    pass
-
-
-class IBKRConnectionError(IBKRException):
+class IBKRConnectionError(IBKRError):
     """Raised when connection to IB Gateway fails."""
     pass
 
 
-class IBKRAuthenticationError(IBKRException):
+class IBKRAuthenticationError(IBKRError):
     """Raised when authentication with IB Gateway fails."""
     pass
 
 
-class IBKROrderError(IBKRException):
+class IBKROrderError(IBKRError):
     """Raised when order placement fails."""
     pass
 
 
-class IBKRMarketDataError(IBKRException):
+class IBKRMarketDataError(IBKRError):
     """Raised when market data request fails."""
     pass
 
 
-class IBKRPositionError(IBKRException):
+class IBKRPositionError(IBKRError):
     """Raised when position retrieval fails."""
     pass
 
 
-class IBKRAccountError(IBKRException):
+class IBKRAccountError(IBKRError):
     """Raised when account data retrieval fails."""
     pass
 
@@ -353,6 +364,16 @@ class DatabaseError(Exception):
 
 
 # Risk management exceptions
+class RiskLimitError(Exception):
+    """Exception raised when risk limits are breached."""
+    pass
+
+
+class CircuitBreakerError(Exception):
+    """Exception raised when circuit breaker is triggered."""
+    pass
+
+
 class RiskCheckError(Exception):
     """Raised when risk check fails."""
     pass
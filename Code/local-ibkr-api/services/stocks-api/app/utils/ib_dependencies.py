@@ -4,9 +4,10 @@ IBKR Client Dependency Provider.
 Provides dependency injection for IBKR client in FastAPI routes,
 allowing easy swapping between real and mock implementations.
 """
-from typing import AsyncGenerator, Optional
+from typing import Optional
 import structlog
 import asyncio
+import threading
 
 from app.ib_client import IBKRClient
 from app.ib_mock import MockIBKRClient
@@ -18,6 +19,13 @@ logger = structlog.get_logger(__name__)
 # Global client instance (singleton)
 _ib_client_instance: IBKRClientProtocol | None = None
 _ib_background_task: Optional[asyncio.Task] = None
+# Guards first creation of the singleton; called from both the event loop
+# and the threaded monitor, so this is a threading lock
+_ib_client_lock = threading.Lock()
+
+# Reconnect backoff bounds (seconds)
+_RECONNECT_INITIAL_DELAY = 1.0
+_RECONNECT_MAX_DELAY = 60.0
 
 
 def create_ib_client() -> IBKRClientProtocol:
@@ -67,34 +75,67 @@ def get_ib_client_singleton() -> IBKRClientProtocol:
     global _ib_client_instance
 
     if _ib_client_instance is None:
-        _ib_client_instance = create_ib_client()
+        with _ib_client_lock:
+            if _ib_client_instance is None:
+                _ib_client_instance = create_ib_client()
 
     return _ib_client_instance
 
 
 async def _ib_message_loop(client: IBKRClientProtocol) -> None:
     """
-    Background task that continuously processes IB messages to keep connection alive.
-    
-    This is CRITICAL for maintaining the IB Gateway connection. Without this,
-    the connection will disconnect immediately after connecting.
+    Background task that reconnects the IB client when the Gateway drops.
+
+    ib_insync pumps IB messages on the event loop itself, so this task does
+    no polling: it sleeps until ``disconnectedEvent`` fires and then
+    reconnects with exponential backoff.
     """
+    if not hasattr(client, "ib"):
+        # Mock clients have no IB instance and never disconnect on their own
+        logger.info("ib_message_loop_skipped", client_type=type(client).__name__)
+        return
+
     logger.info("ib_message_loop_started")
-    
-    while True:
-        try:
-            if hasattr(client, 'ib') and client.ib and client.ib.isConnected():
-                # Process messages - this keeps the connection alive
-                await asyncio.sleep(1)
-            else:
-                logger.warning("ib_not_connected_in_loop")
-                await asyncio.sleep(5)  # Wait before checking again
-        except asyncio.CancelledError:
-            logger.info("ib_message_loop_cancelled")
-            break
-        except Exception as e:
-            logger.error("ib_message_loop_error", error=str(e), error_type=type(e).__name__)
-            await asyncio.sleep(5)  # Brief pause on error
+
+    disconnected = asyncio.Event()
+    # IBKRClient only creates its IB instance on first connect, so subscribe
+    # to whichever instance exists once the client reports it is connected
+    subscribed_ib = None
+    delay = _RECONNECT_INITIAL_DELAY
+
+    try:
+        while True:
+            try:
+                ib = client.ib
+                if ib is not None and client.is_connected():
+                    if ib is not subscribed_ib:
+                        if subscribed_ib is not None:
+                            subscribed_ib.disconnectedEvent -= disconnected.set
+                        ib.disconnectedEvent += disconnected.set
+                        subscribed_ib = ib
+                    disconnected.clear()
+                    await disconnected.wait()
+                    logger.warning("ib_connection_lost")
+                    delay = _RECONNECT_INITIAL_DELAY
+                    continue
+
+                # No IB instance yet counts as disconnected
+                await client.connect()
+                if client.is_connected():
+                    logger.info("ib_reconnected")
+                    continue
+            except Exception as e:
+                logger.error("ib_message_loop_error", error=str(e), error_type=type(e).__name__)
+
+            logger.warning("ib_reconnect_backoff", delay=delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _RECONNECT_MAX_DELAY)
+    except asyncio.CancelledError:
+        logger.info("ib_message_loop_cancelled")
+        raise
+    finally:
+        if subscribed_ib is not None:
+            subscribed_ib.disconnectedEvent -= disconnected.set
 
 
 async def startup_ib_client() -> None:
@@ -110,18 +151,14 @@ async def startup_ib_client() -> None:
         client = get_ib_client_singleton()
         logger.info("got_client_singleton", client_type=type(client).__name__)
         
-        # START BACKGROUND TASK FIRST (before connecting)
-        _ib_background_task = asyncio.create_task(_ib_message_loop(client))
-        logger.info("ib_background_task_started")
-        
-        # Give the task a moment to start
-        await asyncio.sleep(0.1)
-        
-        # Then connect to IB Gateway
+        # Connect to IB Gateway
         if not client.is_connected():
             logger.info("client_not_connected_attempting_connection")
-            success = await client.connect()
-            logger.info("connection_attempt_completed", success=success, is_connected=client.is_connected())
+            try:
+                success = await client.connect()
+                logger.info("connection_attempt_completed", success=success, is_connected=client.is_connected())
+            except Exception as e:
+                logger.error("ib_client_initial_connect_failed", error=str(e), error_type=type(e).__name__)
             
             if client.is_connected():
                 logger.info("ib_client_connected_on_startup")
@@ -129,6 +166,11 @@ async def startup_ib_client() -> None:
                 logger.error("connection_succeeded_but_not_connected")
         else:
             logger.info("client_already_connected")
+        
+        # Start the reconnect task after the initial attempt so the two never
+        # race on the same IB instance
+        _ib_background_task = asyncio.create_task(_ib_message_loop(client))
+        logger.info("ib_background_task_started")
 
     except Exception as e:
         logger.error("ib_client_startup_failed", error=str(e), error_type=type(e).__name__)
@@ -160,30 +202,23 @@ async def shutdown_ib_client() -> None:
         logger.error("ib_client_shutdown_failed", error=str(e))
 
 
-async def get_ib_client() -> AsyncGenerator[IBKRClientProtocol, None]:
+async def get_ib_client() -> IBKRClientProtocol:
     """
     FastAPI dependency provider for IBKR client.
 
-    Yields:
+    Connection state is maintained by the background reconnect task, so this
+    does not probe or reconnect per request; routes handle
+    IBKRConnectionError if the client is down.
+
+    Returns:
         IBKRClientProtocol: The IBKR client instance
 
     Usage in FastAPI routes:
         @router.get("/example")
         async def example(ib_client: IBKRClientProtocol = Depends(get_ib_client)):
-            await ib_client.connect()
             # ... use client
     """
-    client = get_ib_client_singleton()
-
-    # Ensure client is connected
-    if not client.is_connected():
-        try:
-            await client.connect()
-        except Exception as e:
-            logger.error("failed_to_connect_ib_client", error=str(e))
-            # Continue anyway - routes can handle connection errors
-
-    yield client
+    return get_ib_client_singleton()
 
 
 def reset_ib_client() -> None:
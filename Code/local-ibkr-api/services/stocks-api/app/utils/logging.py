@@ -6,6 +6,8 @@ and consistent formatting across the application.
 """
 import logging
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Any, Dict
 
 import structlog
@@ -14,6 +16,11 @@ from structlog.types import EventDict, Processor
 from app.config import get_settings
 
 
+# Listener draining the root logger's queue (see start_log_queue)
+_log_listener: QueueListener | None = None
+_queued_handlers: list[logging.Handler] = []
+
+
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """
     Add application context to log entries.
@@ -116,7 +123,7 @@ def setup_logging() -> None:
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
     
@@ -129,6 +136,53 @@ def setup_logging() -> None:
         logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
 
+def start_log_queue() -> None:
+    """
+    Route root logger output through a queue drained by a listener thread.
+    
+    The root logger's existing handlers move to a QueueListener and are
+    replaced by a single QueueHandler, so a log call on the request path is
+    a queue put instead of a blocking write to stdout or a file.
+    """
+    global _log_listener, _queued_handlers
+    
+    if _log_listener is not None:
+        return
+    
+    root = logging.getLogger()
+    _queued_handlers = list(root.handlers)
+    for handler in _queued_handlers:
+        root.removeHandler(handler)
+    
+    log_queue: SimpleQueue = SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    
+    _log_listener = QueueListener(log_queue, *_queued_handlers, respect_handler_level=True)
+    _log_listener.start()
+
+
+def stop_log_queue() -> None:
+    """
+    Flush queued log records and restore the root logger's handlers.
+    """
+    global _log_listener, _queued_handlers
+    
+    if _log_listener is None:
+        return
+    
+    # stop() processes everything already queued before returning
+    _log_listener.stop()
+    _log_listener = None
+    
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in _queued_handlers:
+        root.addHandler(handler)
+    _queued_handlers = []
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """
     Get a structured logger instance.
@@ -3,13 +3,15 @@ Prometheus Metrics Collection.
 
 Provides metrics for system monitoring, API performance, and business intelligence.
 """
+import asyncio
+import collections
 import time
-from typing import Callable
+from collections import deque
+from functools import lru_cache
 
-from fastapi import Request, Response
-from prometheus_client import Counter, Gauge, Histogram, generate_latest
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.exposition import choose_encoder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.utils.logging import get_logger
 
@@ -36,24 +38,14 @@ api_request_duration_seconds = Histogram(
 api_requests_in_progress = Gauge(
     "api_requests_in_progress",
     "Number of API requests currently being processed",
-    ["method", "endpoint"]
+    ["method"]
 )
 
 # Connection Status Metrics
-ib_connection_status = Gauge(
-    "ib_connection_status",
-    "IB Gateway connection status (1=connected, 0=disconnected)",
-    ["container"]
-)
-
-database_connection_status = Gauge(
-    "database_connection_status",
-    "Database connection status (1=connected, 0=disconnected)"
-)
-
-redis_connection_status = Gauge(
-    "redis_connection_status",
-    "Redis connection status (1=connected, 0=disconnected)"
+connection_status = Gauge(
+    "connection_status",
+    "Component connection status (1=connected, 0=disconnected)",
+    ["component", "instance"]
 )
 
 # ==========================================
@@ -138,11 +130,117 @@ market_data_latency_seconds = Histogram(
 )
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+def _route_template(scope: Scope) -> str:
+    """
+    Get the route template the router matched (e.g. /orders/{order_id}).
+    
+    Using the template rather than the raw path keeps label cardinality
+    bounded by the number of routes. The router stores the matched route
+    on the scope, so this is only meaningful once the app has run.
+    
+    Args:
+        scope: ASGI connection scope
+        
+    Returns:
+        Matched route path template, or "unmatched"
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or "unmatched"
+
+
+@lru_cache(maxsize=32)
+def _in_progress(method: str) -> Gauge:
+    """
+    Get the in-progress gauge child for a method.
+    
+    The route is not known until the router has run, so in-progress
+    requests are tracked per method only.
+    
+    Args:
+        method: HTTP method
+        
+    Returns:
+        In-progress gauge child
+    """
+    return api_requests_in_progress.labels(method=method)
+
+
+# Duration histogram children by (method, endpoint); filled for every route
+# by warmup_metrics, and on first use for anything else
+_duration_children: dict[tuple[str, str], Histogram] = {}
+
+
+def _duration(method: str, endpoint: str) -> Histogram:
+    """
+    Get the duration histogram child for an endpoint.
+    
+    Args:
+        method: HTTP method
+        endpoint: Endpoint label
+        
+    Returns:
+        Duration histogram child
+    """
+    key = (method, endpoint)
+    child = _duration_children.get(key)
+    if child is None:
+        child = _duration_children[key] = api_request_duration_seconds.labels(
+            method=method, endpoint=endpoint
+        )
+    return child
+
+
+@lru_cache(maxsize=2048)
+def _total(method: str, endpoint: str, status_code: int) -> Counter:
+    """
+    Get the request counter child for an endpoint and status code.
+    
+    Args:
+        method: HTTP method
+        endpoint: Endpoint label
+        status_code: Response status code
+        
+    Returns:
+        Request counter child
+    """
+    return api_requests_total.labels(method=method, endpoint=endpoint, status_code=status_code)
+
+
+def warmup_metrics(app: ASGIApp) -> None:
+    """
+    Pre-create the in-progress and duration children for every route.
+    
+    Creating a labelled child takes the metric's lock, so doing it at
+    startup keeps first requests for each route from paying that cost.
+    Only the methods each route declares are warmed, and request counters
+    are left to be created on first use, so scrapes do not carry
+    zero-valued series for status codes a route never returns.
+    
+    Args:
+        app: FastAPI application
+    """
+    count = 0
+    for route in getattr(app, "routes", ()):
+        methods = getattr(route, "methods", None)
+        if not methods:
+            continue
+        # Starlette adds HEAD to GET routes implicitly; it was not declared
+        declared = methods - {"HEAD"} if "GET" in methods else methods
+        for method in declared:
+            _in_progress(method)
+            _duration(method, route.path_format)
+            count += 1
+    
+    logger.info("metrics_warmed_up", children=count)
+
+
+class PrometheusMiddleware:
     """
     Middleware for collecting Prometheus metrics on API requests.
     
-    Records request count, duration, and status codes.
+    Records request count, duration, and status codes. Implemented as a
+    plain ASGI callable to avoid BaseHTTPMiddleware's per-request task and
+    stream overhead.
     """
     
     def __init__(self, app: ASGIApp):
@@ -152,75 +250,155 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         Args:
             app: ASGI application
         """
-        super().__init__(app)
+        self.app = app
         logger.info("prometheus_middleware_initialized")
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and collect metrics.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint
-            
-        Returns:
-            Response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
+        # Skip non-HTTP traffic and the metrics endpoint itself
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        status_code = 500
         
-        method = request.method
-        endpoint = request.url.path
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
         # Track in-progress requests
-        api_requests_in_progress.labels(method=method, endpoint=endpoint).inc()
+        in_progress = _in_progress(method)
+        in_progress.inc()
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             # Record error
             logger.error(
                 "request_processing_error",
                 method=method,
-                endpoint=endpoint,
+                endpoint=_route_template(scope),
                 error=str(e)
             )
             status_code = 500
             raise
         finally:
             # Calculate duration
-            duration = time.time() - start_time
-            
-            # Record metrics
-            api_requests_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code=status_code
-            ).inc()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
-            api_request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
+            # Record metrics; the router has put the matched route on the scope
+            endpoint = _route_template(scope)
+            _total(method, endpoint, status_code).inc()
+            _duration(method, endpoint).observe(duration)
             
             # Decrement in-progress
-            api_requests_in_progress.labels(method=method, endpoint=endpoint).dec()
-        
-        return response
+            in_progress.dec()
+
+
+# ==========================================
+# Buffered Counter Increments
+# ==========================================
+
+# Seconds between flushes of buffered counter increments
+METRICS_FLUSH_INTERVAL = 0.1
+
+# Pending (counter, label values) increments. deque.append is atomic, so
+# hot-path callers never take the counter's lock.
+_pending_increments: deque[tuple[Counter, tuple[str, ...]]] = deque()
+_flush_task: asyncio.Task | None = None
+
+
+def _buffer_inc(counter: Counter, *label_values: str) -> None:
+    """
+    Queue a counter increment to be applied on the next flush.
+    
+    Args:
+        counter: Prometheus counter
+        *label_values: Label values in the counter's label order
+    """
+    _pending_increments.append((counter, label_values))
+
+
+def flush_metrics() -> None:
+    """Apply buffered increments to the real Prometheus counters."""
+    totals: collections.Counter = collections.Counter()
+    popleft = _pending_increments.popleft
+    while True:
+        try:
+            totals[popleft()] += 1
+        except IndexError:
+            break
+    
+    for (counter, label_values), amount in totals.items():
+        counter.labels(*label_values).inc(amount)
+
+
+async def _flush_loop(interval: float) -> None:
+    """Periodically flush buffered counter increments."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            flush_metrics()
+        except Exception as e:
+            # Keep flushing; a dead task would leave counters stale until scrape
+            logger.error("metrics_flush_failed", error=str(e), error_type=type(e).__name__)
+
+
+def start_metrics_flusher(interval: float = METRICS_FLUSH_INTERVAL) -> None:
+    """
+    Start the background task that flushes buffered counter increments.
+    
+    Args:
+        interval: Seconds between flushes
+    """
+    global _flush_task
+    
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_loop(interval))
+        logger.info("metrics_flusher_started", interval=interval)
 
 
-def get_metrics() -> bytes:
+async def stop_metrics_flusher() -> None:
+    """Stop the flusher task and apply any remaining increments."""
+    global _flush_task
+    
+    if _flush_task:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+    
+    flush_metrics()
+    logger.info("metrics_flusher_stopped")
+
+
+def get_metrics(accept: str | None = None) -> tuple[bytes, str]:
     """
     Generate Prometheus metrics output.
     
+    Args:
+        accept: Scraper's Accept header, used to pick text or OpenMetrics
+        
     Returns:
-        Prometheus metrics in text format
+        Tuple of (encoded metrics, content type)
     """
-    return generate_latest()
+    flush_metrics()
+    encoder, content_type = choose_encoder(accept or "")
+    return encoder(REGISTRY), content_type
 
 
 # Helper functions for business metrics
@@ -242,12 +420,7 @@ def record_order(
         container: Container name
         latency: Optional order latency in seconds
     """
-    orders_total.labels(
-        container=container,
-        order_type=order_type,
-        action=action,
-        status=status
-    ).inc()
+    _buffer_inc(orders_total, container, order_type, action, status)
     
     if latency is not None:
         order_latency_seconds.labels(order_type=order_type).observe(latency)
@@ -260,7 +433,7 @@ def record_order_rejection(reason: str):
     Args:
         reason: Rejection reason
     """
-    order_rejections_total.labels(reason=reason).inc()
+    _buffer_inc(order_rejections_total, reason)
 
 
 def update_position_metrics(
@@ -311,7 +484,7 @@ def record_risk_breach(limit_type: str):
     Args:
         limit_type: Type of limit breached
     """
-    risk_limit_breaches_total.labels(limit_type=limit_type).inc()
+    _buffer_inc(risk_limit_breaches_total, limit_type)
 
 
 def record_circuit_breaker(reason: str):
@@ -321,35 +494,16 @@ def record_circuit_breaker(reason: str):
     Args:
         reason: Reason for circuit breaker
     """
-    circuit_breaker_triggered_total.labels(reason=reason).inc()
-
-
-def set_ib_connection_status(connected: bool, container: str = "stocks"):
-    """
-    Set IB Gateway connection status.
-    
-    Args:
-        connected: True if connected
-        container: Container name
-    """
-    ib_connection_status.labels(container=container).set(1 if connected else 0)
-
-
-def set_database_connection_status(connected: bool):
-    """
-    Set database connection status.
-    
-    Args:
-        connected: True if connected
-    """
-    database_connection_status.set(1 if connected else 0)
+    _buffer_inc(circuit_breaker_triggered_total, reason)
 
 
-def set_redis_connection_status(connected: bool):
+def set_connection_status(component: str, connected: bool, instance: str = "default"):
     """
-    Set Redis connection status.
+    Set connection status for a component.
     
     Args:
+        component: Component name (e.g. "ib", "database", "redis")
         connected: True if connected
+        instance: Instance name, e.g. the container for IB connections
     """
-    redis_connection_status.set(1 if connected else 0)
+    connection_status.labels(component=component, instance=instance).set(1 if connected else 0)
@@ -1,5 +1,9 @@
 """Redis client for caching and session management."""
+import asyncio
+import socket
 import redis.asyncio as aioredis
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.connection import parse_url
 from typing import Optional
 import structlog
 from app.config import get_settings
@@ -8,6 +12,21 @@ logger = structlog.get_logger(__name__)
 
 settings = get_settings()
 
+# Seconds to wait for a free pooled connection before raising
+_POOL_TIMEOUT = 5
+# Seconds a connection may sit idle before it is pinged on checkout
+_HEALTH_CHECK_INTERVAL = 30
+# Connections opened at startup so early requests skip connect latency
+_POOL_WARM_CONNECTIONS = 4
+
+# TCP keepalive tuning; the TCP_KEEP* constants are missing on some
+# platforms (e.g. TCP_KEEPIDLE on macOS), so only available ones are set
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
 
 class RedisClient:
     """Async Redis client wrapper."""
@@ -18,12 +37,24 @@ class RedisClient:
     async def connect(self):
         """Connect to Redis."""
         try:
-            self.client = await aioredis.from_url(
-                settings.REDIS_URL,
-                encoding="utf-8",
-                decode_responses=True
-            )
-            logger.info("redis_connected")
+            pool_kwargs = {
+                "max_connections": settings.REDIS_POOL_SIZE,
+                "timeout": _POOL_TIMEOUT,
+                "socket_keepalive": True,
+                "socket_keepalive_options": _KEEPALIVE_OPTIONS,
+                "health_check_interval": _HEALTH_CHECK_INTERVAL,
+                "encoding": "utf-8",
+                "decode_responses": True,
+            }
+            # Options given in the URL take precedence, as with from_url()
+            pool = BlockingConnectionPool(**{**pool_kwargs, **parse_url(settings.REDIS_URL)})
+            self.client = aioredis.Redis(connection_pool=pool)
+            # Open a few pooled connections up front
+            await asyncio.gather(*(
+                self.client.ping()
+                for _ in range(min(_POOL_WARM_CONNECTIONS, settings.REDIS_POOL_SIZE))
+            ))
+            logger.info("redis_connected", pool_size=settings.REDIS_POOL_SIZE)
         except Exception as e:
             logger.error("redis_connection_failed", error=str(e))
             raise
@@ -31,7 +62,7 @@ class RedisClient:
     async def disconnect(self):
         """Disconnect from Redis."""
         if self.client:
-            await self.client.close()
+            await self.client.aclose(close_connection_pool=True)
             logger.info("redis_disconnected")
     
     async def ping(self) -> bool:
@@ -0,0 +1,54 @@
+"""
+Shared pytest fixtures.
+"""
+from functools import lru_cache
+
+# Import ib_insync once per session up front; it is heavy and every IB test
+# module needs it
+import ib_insync  # noqa: F401
+import pytest
+from pytest_asyncio import is_async_test
+
+from app.config import Settings
+from app.ib_mock import MockIBKRClient
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_mock_delays():
+    """
+    Make MockIBKRClient's simulated delays free for the whole session.
+    
+    Scaling the delays to zero keeps the simulate_delays flag meaningful
+    and keeps each simulated sleep as an event-loop yield point, without
+    touching asyncio itself.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MockIBKRClient, "delay_scale", 0.0)
+        yield
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            # Only async tests; the asyncio mark on a sync test warns
+            item.add_marker(session_loop, append=False)
+
+
+@lru_cache(maxsize=None)
+def _mk_settings(**kwargs) -> Settings:
+    """Build Settings once per distinct set of keyword arguments."""
+    return Settings(**kwargs)
+
+
+@pytest.fixture(scope="session")
+def make_settings():
+    """
+    Factory for validated Settings, shared across tests with equal kwargs.
+    
+    Only use for read-only checks of valid configurations; tests that
+    mutate the instance or expect validation errors should construct
+    Settings directly.
+    """
+    return _mk_settings
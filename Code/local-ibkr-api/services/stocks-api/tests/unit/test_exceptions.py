@@ -0,0 +1,68 @@
+"""
+Unit tests for the global exception handlers.
+
+Tests the error bodies produced for HTTP, validation and unhandled errors.
+"""
+import pytest
+from fastapi import FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
+
+from app.utils.exceptions import register_exception_handlers
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client for an app with the handlers registered."""
+    app = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestExceptionHandlers:
+    """Test error response bodies."""
+
+    def test_http_exception_body(self, client):
+        """Test HTTP exceptions map to a machine-readable error code."""
+        response = client.get("/missing")
+        data = response.json()
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert data["error_code"] == "NOT_FOUND"
+        assert data["message"] == "Order not found"
+        assert data["path"] == "/missing"
+        assert "timestamp" in data
+        # Unset optional fields are omitted
+        assert "details" not in data
+
+    def test_validation_error_body(self, client):
+        """Test validation errors list each failing field."""
+        response = client.get("/items/abc")
+        data = response.json()
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert data["error_code"] == "VALIDATION_ERROR"
+        assert data["details"][0]["field"] == "path.item_id"
+        assert "message" in data["details"][0]
+        assert "type" in data["details"][0]
+
+    def test_unhandled_exception_body(self, client):
+        """Test unhandled exceptions return a generic 500 body."""
+        response = client.get("/boom")
+        data = response.json()
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert data["error_code"] == "INTERNAL_SERVER_ERROR"
+        assert data["details"] == {"error_type": "RuntimeError"}
@@ -4,33 +4,68 @@ Unit tests for IBKR Client.
 Tests the IBKRClient wrapper including connection management,
 error handling, and retry logic.
 """
+import copy
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-from ib_insync import IB, Contract, Order, Trade, OrderStatus, Stock, LimitOrder
+from unittest.mock import Mock, MagicMock, AsyncMock, call
+from ib_insync import Contract, Order, Trade, OrderStatus, Stock, LimitOrder
 import asyncio
 
 from app.ib_client import IBKRClient
 from app.utils.exceptions import IBKRConnectionError, IBKROrderError
 
+# Canonical contracts/orders built once; tests that mutate them take a copy
+_AAPL = Stock("AAPL", "SMART", "USD")
+_BUY_LIMIT = LimitOrder("BUY", 100, 150.0)
+
+
+class _StubIB:
+    """
+    Minimal stand-in for ib_insync.IB exposing only what these tests touch.
+
+    Cheaper than Mock(spec=IB), which introspects IB's whole attribute tree
+    on every construction.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Restore fresh mocks for every IB method and event."""
+        self.isConnected = Mock(return_value=False)
+        self.connectAsync = AsyncMock(return_value=None)
+        self.waitOnUpdate = AsyncMock(return_value=True)
+        self.disconnect = Mock()
+        self.placeOrder = Mock()
+        self.cancelOrder = Mock()
+        self.positions = Mock(return_value=[])
+        self.portfolio = Mock(return_value=[])
+        self.accountValues = Mock(return_value=[])
+        self.reqMktData = Mock()
+        self.cancelMktData = Mock()
+        self.trades = Mock(return_value=[])
+        self.openTrades = Mock(return_value=[])
+        self.fills = Mock(return_value=[])
+        self.client = Mock()
+        self.errorEvent = MagicMock()
+        self.disconnectedEvent = MagicMock()
+        self.orderStatusEvent = MagicMock()
+        self.newOrderEvent = MagicMock()
+        self.fillEvent = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def _stub_ib():
+    """Create one stub IB instance per module."""
+    return _StubIB()
+
 
 @pytest.fixture
-def mock_ib():
-    """Create a mock IB instance."""
-    mock = Mock(spec=IB)
-    mock.isConnected.return_value = False
-    mock.connectAsync = AsyncMock(return_value=None)
-    mock.disconnect = Mock()
-    mock.placeOrder = Mock()
-    mock.cancelOrder = Mock()
-    mock.positions = Mock(return_value=[])
-    mock.portfolio = Mock(return_value=[])
-    mock.accountValues = Mock(return_value=[])
-    mock.reqMktData = Mock()
-    mock.cancelMktData = Mock()
-    mock.openTrades = Mock(return_value=[])
-    mock.fills = Mock(return_value=[])
-    mock.sleep = AsyncMock()
-    return mock
+def mock_ib(_stub_ib):
+    """Provide the module's stub IB instance with fresh mocks."""
+    _stub_ib.reset()
+    return _stub_ib
 
 
 @pytest.fixture
@@ -83,7 +118,14 @@ class TestIBKRClientInitialization:
 class TestIBKRClientConnection:
     """Test IBKR client connection management."""
 
-    @pytest.mark.asyncio
+    @pytest.fixture(autouse=True)
+    def _fast_sleep(self, monkeypatch):
+        """Make retry backoff return immediately instead of waiting."""
+        fake_sleep = AsyncMock(return_value=None)
+        monkeypatch.setattr("app.ib_client.asyncio.sleep", fake_sleep)
+        monkeypatch.setattr("time.sleep", Mock(return_value=None))
+        return fake_sleep
+
     async def test_successful_connection(self, ib_client, mock_ib):
         """Test successful connection to IB Gateway."""
         mock_ib.isConnected.return_value = True
@@ -95,7 +137,6 @@ class TestIBKRClientConnection:
         assert ib_client.connected is True
         mock_ib.connectAsync.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_already_connected(self, ib_client, mock_ib):
         """Test connecting when already connected."""
         mock_ib.isConnected.return_value = True
@@ -108,48 +149,50 @@ class TestIBKRClientConnection:
         # Should not attempt new connection
         mock_ib.connectAsync.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_connection_with_retry(self, ib_client):
+    async def test_connection_with_retry(self, ib_client, mock_ib, _fast_sleep):
         """Test connection retry logic on failure."""
-        with patch.object(IB, 'connectAsync', new_callable=AsyncMock) as mock_connect:
-            # First attempt fails, second succeeds
-            mock_connect.side_effect = [
-                ConnectionRefusedError("Connection refused"),
-                None
-            ]
+        calls = {"n": 0}
 
-            mock_ib = Mock(spec=IB)
-            mock_ib.isConnected.side_effect = [False, True]
-            mock_ib.connectAsync = mock_connect
-            mock_ib.errorEvent = Mock()
-            mock_ib.disconnectedEvent = Mock()
+        async def _fake_connect(*args, **kwargs):
+            # First attempt fails, second succeeds
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise ConnectionRefusedError("Connection refused")
+            return None
 
-            ib_client.ib = mock_ib
+        mock_ib.connectAsync = _fake_connect
+        mock_ib.isConnected.return_value = True
+        ib_client.ib = mock_ib
 
-            result = await ib_client.connect()
+        result = await ib_client.connect()
 
-            assert result is True
-            assert mock_connect.call_count == 2
+        assert result is True
+        assert calls["n"] == 2
+        # One refused attempt, so one backoff of retry_delay * attempt
+        _fast_sleep.assert_awaited_once_with(ib_client.retry_delay * 1)
 
-    @pytest.mark.asyncio
-    async def test_connection_max_retries_exceeded(self, ib_client):
+    async def test_connection_max_retries_exceeded(self, ib_client, mock_ib, _fast_sleep):
         """Test connection failure after max retries."""
-        with patch.object(IB, 'connectAsync', new_callable=AsyncMock) as mock_connect:
-            mock_connect.side_effect = ConnectionRefusedError("Connection refused")
+        calls = {"n": 0}
 
-            mock_ib = Mock(spec=IB)
-            mock_ib.isConnected.return_value = False
-            mock_ib.connectAsync = mock_connect
+        async def _fake_connect(*args, **kwargs):
+            calls["n"] += 1
+            raise ConnectionRefusedError("Connection refused")
 
-            ib_client.ib = mock_ib
+        mock_ib.connectAsync = _fake_connect
+        ib_client.ib = mock_ib
 
-            with pytest.raises(IBKRConnectionError) as exc_info:
-                await ib_client.connect()
+        with pytest.raises(IBKRConnectionError) as exc_info:
+            await ib_client.connect()
 
-            assert "Failed to connect" in str(exc_info.value)
-            assert mock_connect.call_count == ib_client.max_retries
+        assert "Failed to connect" in str(exc_info.value)
+        assert calls["n"] == ib_client.max_retries
+        # Every attempt is refused; each but the last backs off retry_delay * attempt
+        assert _fast_sleep.await_args_list == [
+            call(ib_client.retry_delay * attempt)
+            for attempt in range(1, ib_client.max_retries)
+        ]
 
-    @pytest.mark.asyncio
     async def test_disconnect(self, ib_client, mock_ib):
         """Test disconnection from IB Gateway."""
         mock_ib.isConnected.return_value = True
@@ -161,7 +204,6 @@ class TestIBKRClientConnection:
         assert ib_client.connected is False
         mock_ib.disconnect.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_disconnect_when_not_connected(self, ib_client):
         """Test disconnect when not connected."""
         ib_client.ib = None
@@ -195,16 +237,17 @@ class TestIBKRClientConnection:
 class TestIBKRClientOrders:
     """Test IBKR client order operations."""
 
-    @pytest.mark.asyncio
-    async def test_place_order_success(self, ib_client, mock_ib):
+    async def test_place_order_success(self, ib_client, mock_ib, monkeypatch):
         """Test successful order placement."""
+        fake_sleep = AsyncMock(return_value=None)
+        monkeypatch.setattr("app.ib_client.asyncio.sleep", fake_sleep)
         mock_ib.isConnected.return_value = True
         ib_client.ib = mock_ib
         ib_client.connected = True
 
         # Create test contract and order
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = _BUY_LIMIT
 
         # Create mock trade
         mock_trade = Trade(
@@ -219,22 +262,9 @@ class TestIBKRClientOrders:
 
         assert result == mock_trade
         mock_ib.placeOrder.assert_called_once_with(contract, order)
-        mock_ib.sleep.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_place_order_not_connected(self, ib_client):
-        """Test order placement when not connected."""
-        ib_client.connected = False
-
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        # Waits once for the Gateway to acknowledge the order
+        fake_sleep.assert_awaited_once_with(1)
 
-        with pytest.raises(IBKRConnectionError) as exc_info:
-            await ib_client.place_order(contract, order)
-
-        assert "Not connected" in str(exc_info.value)
-
-    @pytest.mark.asyncio
     async def test_place_order_error(self, ib_client, mock_ib):
         """Test order placement error handling."""
         mock_ib.isConnected.return_value = True
@@ -242,15 +272,14 @@ class TestIBKRClientOrders:
         ib_client.ib = mock_ib
         ib_client.connected = True
 
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = _BUY_LIMIT
 
         with pytest.raises(IBKROrderError) as exc_info:
             await ib_client.place_order(contract, order)
 
         assert "Order placement failed" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_cancel_order_success(self, ib_client, mock_ib):
         """Test successful order cancellation."""
         mock_ib.isConnected.return_value = True
@@ -259,32 +288,42 @@ class TestIBKRClientOrders:
 
         order = Order()
         order.orderId = 123
+        # cancel_order takes an order ID and looks the trade up in trades()
+        mock_ib.trades.return_value = [SimpleNamespace(order=order)]
 
-        result = await ib_client.cancel_order(order)
+        result = await ib_client.cancel_order(order.orderId)
 
         assert result is True
         mock_ib.cancelOrder.assert_called_once_with(order)
 
-    @pytest.mark.asyncio
-    async def test_cancel_order_not_connected(self, ib_client):
-        """Test order cancellation when not connected."""
-        ib_client.connected = False
 
-        order = Order()
-        order.orderId = 123
+class TestIBKRClientRequiresConnection:
+    """Test that IBKR client operations refuse to run while disconnected."""
+
+    @pytest.mark.parametrize("method,args", [
+        ("place_order", (_AAPL, _BUY_LIMIT)),
+        ("cancel_order", (123,)),
+        ("get_positions", ()),
+        ("get_portfolio_items", ()),
+        ("get_account_summary", ()),
+        ("get_open_orders", ()),
+        ("get_fills", ()),
+    ])
+    async def test_requires_connection(self, ib_client, method, args):
+        """Test operation raises IBKRConnectionError when not connected."""
+        ib_client.connected = False
 
-        with pytest.raises(IBKRConnectionError):
-            await ib_client.cancel_order(order)
+        with pytest.raises(IBKRConnectionError, match="Not connected"):
+            await getattr(ib_client, method)(*args)
 
 
 class TestIBKRClientPositions:
     """Test IBKR client position operations."""
 
-    @pytest.mark.asyncio
     async def test_get_positions_success(self, ib_client, mock_ib):
         """Test successful retrieval of positions."""
         mock_ib.isConnected.return_value = True
-        mock_positions = [Mock(), Mock()]
+        mock_positions = [object(), object()]
         mock_ib.positions.return_value = mock_positions
         ib_client.ib = mock_ib
         ib_client.connected = True
@@ -294,19 +333,10 @@ class TestIBKRClientPositions:
         assert result == mock_positions
         mock_ib.positions.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_positions_not_connected(self, ib_client):
-        """Test get positions when not connected."""
-        ib_client.connected = False
-
-        with pytest.raises(IBKRConnectionError):
-            await ib_client.get_positions()
-
-    @pytest.mark.asyncio
     async def test_get_portfolio_items_success(self, ib_client, mock_ib):
         """Test successful retrieval of portfolio items."""
         mock_ib.isConnected.return_value = True
-        mock_portfolio = [Mock(), Mock(), Mock()]
+        mock_portfolio = [object(), object(), object()]
         mock_ib.portfolio.return_value = mock_portfolio
         ib_client.ib = mock_ib
         ib_client.connected = True
@@ -316,23 +346,14 @@ class TestIBKRClientPositions:
         assert result == mock_portfolio
         mock_ib.portfolio.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_account_summary_success(self, ib_client, mock_ib):
         """Test successful retrieval of account summary."""
         mock_ib.isConnected.return_value = True
 
-        # Create mock account values
-        mock_av1 = Mock()
-        mock_av1.tag = "NetLiquidation"
-        mock_av1.value = "100000.00"
-        mock_av1.currency = "USD"
-
-        mock_av2 = Mock()
-        mock_av2.tag = "TotalCashValue"
-        mock_av2.value = "50000.00"
-        mock_av2.currency = "USD"
-
-        mock_ib.accountValues.return_value = [mock_av1, mock_av2]
+        mock_ib.accountValues.return_value = [
+            SimpleNamespace(tag="NetLiquidation", value="100000.00", currency="USD"),
+            SimpleNamespace(tag="TotalCashValue", value="50000.00", currency="USD"),
+        ]
         ib_client.ib = mock_ib
         ib_client.connected = True
 
@@ -347,14 +368,13 @@ class TestIBKRClientPositions:
 class TestIBKRClientMarketData:
     """Test IBKR client market data operations."""
 
-    @pytest.mark.asyncio
     async def test_request_market_data_success(self, ib_client, mock_ib):
         """Test successful market data request."""
         mock_ib.isConnected.return_value = True
         ib_client.ib = mock_ib
         ib_client.connected = True
 
-        contract = Stock("AAPL", "SMART", "USD")
+        contract = copy.copy(_AAPL)
         contract.conId = 12345
 
         result = await ib_client.request_market_data(contract)
@@ -363,14 +383,13 @@ class TestIBKRClientMarketData:
         mock_ib.reqMktData.assert_called_once()
         assert 12345 in ib_client._market_data_subscriptions
 
-    @pytest.mark.asyncio
     async def test_cancel_market_data_success(self, ib_client, mock_ib):
         """Test successful market data cancellation."""
         mock_ib.isConnected.return_value = True
         ib_client.ib = mock_ib
         ib_client.connected = True
 
-        contract = Stock("AAPL", "SMART", "USD")
+        contract = copy.copy(_AAPL)
         contract.conId = 12345
         ib_client._market_data_subscriptions.add(12345)
 
@@ -384,11 +403,10 @@ class TestIBKRClientMarketData:
 class TestIBKRClientTrades:
     """Test IBKR client trade operations."""
 
-    @pytest.mark.asyncio
     async def test_get_open_orders_success(self, ib_client, mock_ib):
         """Test successful retrieval of open orders."""
         mock_ib.isConnected.return_value = True
-        mock_trades = [Mock(), Mock()]
+        mock_trades = [object(), object()]
         mock_ib.openTrades.return_value = mock_trades
         ib_client.ib = mock_ib
         ib_client.connected = True
@@ -398,11 +416,10 @@ class TestIBKRClientTrades:
         assert result == mock_trades
         mock_ib.openTrades.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_fills_success(self, ib_client, mock_ib):
         """Test successful retrieval of fills."""
         mock_ib.isConnected.return_value = True
-        mock_fills = [Mock(), Mock(), Mock()]
+        mock_fills = [object(), object(), object()]
         mock_ib.fills.return_value = mock_fills
         ib_client.ib = mock_ib
         ib_client.connected = True
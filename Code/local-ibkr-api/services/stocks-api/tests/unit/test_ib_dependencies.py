@@ -0,0 +1,145 @@
+"""
+Unit tests for the IBKR client dependency provider.
+
+Tests the background task that reconnects the IB client when the
+Gateway connection drops.
+"""
+import asyncio
+import itertools
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.utils.ib_dependencies import _ib_message_loop
+
+
+class _FakeEvent:
+    """Minimal ib_insync-style event supporting += / -= and emit()."""
+
+    def __init__(self):
+        self.handlers = []
+        self.subscriptions = 0
+
+    def __iadd__(self, handler):
+        self.handlers.append(handler)
+        self.subscriptions += 1
+        return self
+
+    def __isub__(self, handler):
+        self.handlers.remove(handler)
+        return self
+
+    def emit(self):
+        for handler in list(self.handlers):
+            handler()
+
+
+class _FakeIB:
+    """Stand-in for ib_insync.IB exposing only disconnectedEvent."""
+
+    def __init__(self):
+        self.disconnectedEvent = _FakeEvent()
+
+
+class _FakeClient:
+    """
+    IBKRClient stand-in driven by a script of connect() outcomes.
+
+    Each outcome is True (connect, then drop on the next loop iteration),
+    False (stay disconnected), or an exception to raise. Like IBKRClient,
+    it has no IB instance until the first successful connect.
+    """
+
+    def __init__(self, outcomes):
+        self.ib = None
+        self.ibs = []
+        self.connect_calls = 0
+        self._connected = False
+        self._outcomes = iter(outcomes)
+
+    def is_connected(self):
+        return self._connected
+
+    async def connect(self):
+        self.connect_calls += 1
+        outcome = next(self._outcomes)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if outcome:
+            self.ib = _FakeIB()
+            self.ibs.append(self.ib)
+            self._connected = True
+            asyncio.get_running_loop().call_soon(self._drop)
+        return outcome
+
+    def _drop(self):
+        self._connected = False
+        self.ib.disconnectedEvent.emit()
+
+
+@pytest.fixture
+def fake_sleep(monkeypatch):
+    """Record backoff delays instead of waiting."""
+    sleep = AsyncMock(return_value=None)
+    monkeypatch.setattr("app.utils.ib_dependencies.asyncio.sleep", sleep)
+    return sleep
+
+
+def _delays(sleep):
+    return [c.args[0] for c in sleep.await_args_list]
+
+
+class TestIBMessageLoop:
+    """Test reconnecting the IB client on disconnect."""
+
+    async def test_skips_clients_without_ib(self, fake_sleep):
+        """Test clients with no IB instance attribute (mocks) are left alone."""
+        await _ib_message_loop(object())
+
+        fake_sleep.assert_not_awaited()
+
+    async def test_reconnects_after_each_disconnect(self, fake_sleep):
+        """Test each disconnectedEvent leads to exactly one reconnect."""
+        client = _FakeClient([True, True, asyncio.CancelledError()])
+
+        with pytest.raises(asyncio.CancelledError):
+            await _ib_message_loop(client)
+
+        # Initial connect (no IB instance yet), a reconnect per drop
+        assert client.connect_calls == 3
+        fake_sleep.assert_not_awaited()
+
+    async def test_subscribes_to_each_new_ib_instance(self, fake_sleep):
+        """Test the loop follows the IB instance across reconnects."""
+        client = _FakeClient([True, True, asyncio.CancelledError()])
+
+        with pytest.raises(asyncio.CancelledError):
+            await _ib_message_loop(client)
+
+        assert len(client.ibs) == 2
+        for ib in client.ibs:
+            assert ib.disconnectedEvent.subscriptions == 1
+            # Unsubscribed when replaced, and on exit
+            assert ib.disconnectedEvent.handlers == []
+
+    async def test_backoff_doubles_up_to_cap(self, fake_sleep):
+        """Test failed reconnects back off from 1s, doubling to 60s."""
+        client = _FakeClient(itertools.repeat(False))
+        fake_sleep.side_effect = [None] * 7 + [asyncio.CancelledError()]
+
+        with pytest.raises(asyncio.CancelledError):
+            await _ib_message_loop(client)
+
+        assert _delays(fake_sleep) == [1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0]
+        assert client.connect_calls == 8
+
+    async def test_backoff_resets_after_reconnect(self, fake_sleep):
+        """Test connect errors back off, and a later drop starts again at 1s."""
+        client = _FakeClient([ConnectionRefusedError("refused"), False, True, False])
+        fake_sleep.side_effect = [None, None, asyncio.CancelledError()]
+
+        with pytest.raises(asyncio.CancelledError):
+            await _ib_message_loop(client)
+
+        assert _delays(fake_sleep) == [1.0, 2.0, 1.0]
+        assert client.connect_calls == 4
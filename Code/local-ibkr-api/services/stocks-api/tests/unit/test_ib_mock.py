@@ -4,16 +4,31 @@ Unit tests for Mock IBKR Client.
 Tests the MockIBKRClient to ensure it properly simulates IBKR behavior
 for testing purposes.
 """
+import asyncio
+import copy
+
 import pytest
 from ib_insync import Stock, LimitOrder, MarketOrder
 
 from app.ib_mock import MockIBKRClient
 from app.utils.exceptions import IBKRConnectionError, IBKROrderError
 
+# Canonical contracts/orders built once. Contracts are only read by the
+# mock; orders get their orderId assigned on placement, so tests copy them.
+_AAPL = Stock("AAPL", "SMART", "USD")
+_MSFT = Stock("MSFT", "SMART", "USD")
+_GOOGL = Stock("GOOGL", "SMART", "USD")
+_BUY_LIMIT = LimitOrder("BUY", 100, 150.0)
+_SELL_MKT = MarketOrder("SELL", 50)
 
-@pytest.fixture
-def mock_client():
-    """Create a MockIBKRClient instance for testing."""
+# Keep every mock-client test on one xdist worker so the shared client
+# fixture stays consistent; run with `pytest -n auto --dist=loadgroup`
+pytestmark = pytest.mark.xdist_group(name="mock_client")
+
+
+@pytest.fixture(scope="session")
+def _mock_client_singleton():
+    """Create one MockIBKRClient shared by the whole session."""
     return MockIBKRClient(
         host="mock-gateway",
         port=4003,
@@ -23,6 +38,19 @@ def mock_client():
     )
 
 
+@pytest.fixture
+def mock_client(_mock_client_singleton):
+    """Provide the shared MockIBKRClient, reset to a fresh connected state."""
+    client = _mock_client_singleton
+    client.clear_orders()
+    client._positions = []
+    client._portfolio_items = []
+    client._market_data_subscriptions.clear()
+    client._account_summary = client._generate_mock_account_summary()
+    client.connected = True
+    yield client
+
+
 class TestMockIBKRClientInitialization:
     """Test mock IBKR client initialization."""
 
@@ -62,7 +90,6 @@ class TestMockIBKRClientInitialization:
 class TestMockIBKRClientConnection:
     """Test mock IBKR client connection management."""
 
-    @pytest.mark.asyncio
     async def test_connect_success(self):
         """Test mock client connection always succeeds."""
         client = MockIBKRClient(auto_connect=False)
@@ -72,7 +99,6 @@ class TestMockIBKRClientConnection:
         assert result is True
         assert client.connected is True
 
-    @pytest.mark.asyncio
     async def test_disconnect(self, mock_client):
         """Test mock client disconnection."""
         assert mock_client.connected is True
@@ -92,11 +118,10 @@ class TestMockIBKRClientConnection:
 class TestMockIBKRClientOrders:
     """Test mock IBKR client order operations."""
 
-    @pytest.mark.asyncio
     async def test_place_order_success(self, mock_client):
         """Test successful mock order placement."""
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = copy.copy(_BUY_LIMIT)
 
         trade = await mock_client.place_order(contract, order)
 
@@ -106,14 +131,13 @@ class TestMockIBKRClientOrders:
         assert trade.contract.symbol == "AAPL"
         assert trade.orderStatus.status == "Filled"  # Mock auto-fills
 
-    @pytest.mark.asyncio
     async def test_place_multiple_orders(self, mock_client):
         """Test placing multiple mock orders."""
-        contract1 = Stock("AAPL", "SMART", "USD")
-        order1 = LimitOrder("BUY", 100, 150.0)
+        contract1 = _AAPL
+        order1 = copy.copy(_BUY_LIMIT)
 
-        contract2 = Stock("MSFT", "SMART", "USD")
-        order2 = MarketOrder("SELL", 50)
+        contract2 = _MSFT
+        order2 = copy.copy(_SELL_MKT)
 
         trade1 = await mock_client.place_order(contract1, order1)
         trade2 = await mock_client.place_order(contract2, order2)
@@ -122,23 +146,21 @@ class TestMockIBKRClientOrders:
         assert trade2.order.orderId == 2
         assert len(mock_client._trades) == 2
 
-    @pytest.mark.asyncio
     async def test_place_order_not_connected(self, mock_client):
         """Test order placement when not connected."""
         mock_client.connected = False
 
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = copy.copy(_BUY_LIMIT)
 
         with pytest.raises(IBKRConnectionError) as exc_info:
             await mock_client.place_order(contract, order)
 
         assert "not connected" in str(exc_info.value).lower()
 
-    @pytest.mark.asyncio
     async def test_place_order_invalid_quantity(self, mock_client):
         """Test order placement with invalid quantity."""
-        contract = Stock("AAPL", "SMART", "USD")
+        contract = _AAPL
         order = LimitOrder("BUY", 0, 150.0)  # Invalid quantity
 
         with pytest.raises(IBKROrderError) as exc_info:
@@ -146,11 +168,10 @@ class TestMockIBKRClientOrders:
 
         assert "quantity must be positive" in str(exc_info.value).lower()
 
-    @pytest.mark.asyncio
     async def test_cancel_order_success(self, mock_client):
         """Test successful mock order cancellation."""
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = copy.copy(_BUY_LIMIT)
 
         trade = await mock_client.place_order(contract, order)
         result = await mock_client.cancel_order(trade.order)
@@ -158,10 +179,9 @@ class TestMockIBKRClientOrders:
         assert result is True
         assert trade.orderStatus.status == "Cancelled"
 
-    @pytest.mark.asyncio
     async def test_cancel_order_not_found(self, mock_client):
         """Test canceling non-existent order."""
-        order = LimitOrder("BUY", 100, 150.0)
+        order = copy.copy(_BUY_LIMIT)
         order.orderId = 999  # Non-existent order ID
 
         with pytest.raises(IBKROrderError) as exc_info:
@@ -169,12 +189,11 @@ class TestMockIBKRClientOrders:
 
         assert "not found" in str(exc_info.value).lower()
 
-    @pytest.mark.asyncio
     async def test_cancel_order_not_connected(self, mock_client):
         """Test cancel order when not connected."""
         mock_client.connected = False
 
-        order = LimitOrder("BUY", 100, 150.0)
+        order = copy.copy(_BUY_LIMIT)
         order.orderId = 1
 
         with pytest.raises(IBKRConnectionError):
@@ -184,7 +203,6 @@ class TestMockIBKRClientOrders:
 class TestMockIBKRClientPositions:
     """Test mock IBKR client position operations."""
 
-    @pytest.mark.asyncio
     async def test_get_positions_empty(self, mock_client):
         """Test getting positions when none exist."""
         positions = await mock_client.get_positions()
@@ -192,12 +210,9 @@ class TestMockIBKRClientPositions:
         assert isinstance(positions, list)
         assert len(positions) == 0
 
-    @pytest.mark.asyncio
     async def test_get_positions_with_data(self, mock_client):
         """Test getting positions with mock data."""
-        from unittest.mock import Mock
-
-        mock_positions = [Mock(), Mock()]
+        mock_positions = [object(), object()]
         mock_client.set_positions(mock_positions)
 
         positions = await mock_client.get_positions()
@@ -205,7 +220,6 @@ class TestMockIBKRClientPositions:
         assert positions == mock_positions
         assert len(positions) == 2
 
-    @pytest.mark.asyncio
     async def test_get_positions_not_connected(self, mock_client):
         """Test get positions when not connected."""
         mock_client.connected = False
@@ -213,12 +227,9 @@ class TestMockIBKRClientPositions:
         with pytest.raises(IBKRConnectionError):
             await mock_client.get_positions()
 
-    @pytest.mark.asyncio
     async def test_get_portfolio_items(self, mock_client):
         """Test getting portfolio items."""
-        from unittest.mock import Mock
-
-        mock_items = [Mock(), Mock(), Mock()]
+        mock_items = [object(), object(), object()]
         mock_client.set_portfolio_items(mock_items)
 
         items = await mock_client.get_portfolio_items()
@@ -230,7 +241,6 @@ class TestMockIBKRClientPositions:
 class TestMockIBKRClientAccount:
     """Test mock IBKR client account operations."""
 
-    @pytest.mark.asyncio
     async def test_get_account_summary(self, mock_client):
         """Test getting mock account summary."""
         summary = await mock_client.get_account_summary()
@@ -241,7 +251,6 @@ class TestMockIBKRClientAccount:
         assert "BuyingPower_USD" in summary
         assert float(summary["NetLiquidation_USD"]) > 0
 
-    @pytest.mark.asyncio
     async def test_set_custom_account_summary(self, mock_client):
         """Test setting custom account summary."""
         custom_summary = {
@@ -259,10 +268,9 @@ class TestMockIBKRClientAccount:
 class TestMockIBKRClientMarketData:
     """Test mock IBKR client market data operations."""
 
-    @pytest.mark.asyncio
     async def test_request_market_data(self, mock_client):
         """Test requesting mock market data."""
-        contract = Stock("AAPL", "SMART", "USD")
+        contract = copy.copy(_AAPL)
         contract.conId = 12345
 
         result = await mock_client.request_market_data(contract)
@@ -270,10 +278,9 @@ class TestMockIBKRClientMarketData:
         assert result is True
         assert 12345 in mock_client._market_data_subscriptions
 
-    @pytest.mark.asyncio
     async def test_cancel_market_data(self, mock_client):
         """Test canceling mock market data."""
-        contract = Stock("AAPL", "SMART", "USD")
+        contract = copy.copy(_AAPL)
         contract.conId = 12345
 
         await mock_client.request_market_data(contract)
@@ -288,7 +295,6 @@ class TestMockIBKRClientMarketData:
 class TestMockIBKRClientTrades:
     """Test mock IBKR client trade operations."""
 
-    @pytest.mark.asyncio
     async def test_get_open_orders_empty(self, mock_client):
         """Test getting open orders when none exist."""
         orders = await mock_client.get_open_orders()
@@ -296,12 +302,11 @@ class TestMockIBKRClientTrades:
         assert isinstance(orders, list)
         assert len(orders) == 0
 
-    @pytest.mark.asyncio
     async def test_get_open_orders_with_orders(self, mock_client):
         """Test getting open orders after placing orders."""
         # Place an order but cancel it before fill completes
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = copy.copy(_BUY_LIMIT)
 
         # Place order - it will auto-fill in mock
         await mock_client.place_order(contract, order)
@@ -312,11 +317,10 @@ class TestMockIBKRClientTrades:
         # All orders are filled in mock, so no open orders
         assert len(orders) == 0
 
-    @pytest.mark.asyncio
     async def test_get_fills(self, mock_client):
         """Test getting fills after orders are filled."""
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = copy.copy(_BUY_LIMIT)
 
         await mock_client.place_order(contract, order)
 
@@ -337,14 +341,13 @@ class TestMockIBKRClientHelpers:
 
         assert mock_client.connected is False
 
-    @pytest.mark.asyncio
     async def test_get_placed_orders(self, mock_client):
         """Test getting all placed orders."""
-        contract1 = Stock("AAPL", "SMART", "USD")
-        order1 = LimitOrder("BUY", 100, 150.0)
+        contract1 = _AAPL
+        order1 = copy.copy(_BUY_LIMIT)
 
-        contract2 = Stock("MSFT", "SMART", "USD")
-        order2 = MarketOrder("SELL", 50)
+        contract2 = _MSFT
+        order2 = copy.copy(_SELL_MKT)
 
         await mock_client.place_order(contract1, order1)
         await mock_client.place_order(contract2, order2)
@@ -358,10 +361,9 @@ class TestMockIBKRClientHelpers:
     def test_clear_orders(self, mock_client):
         """Test clearing all orders."""
         # Manually add some trades
-        from unittest.mock import Mock
-        mock_client._trades[1] = Mock()
-        mock_client._trades[2] = Mock()
-        mock_client._fills = [Mock(), Mock()]
+        mock_client._trades[1] = object()
+        mock_client._trades[2] = object()
+        mock_client._fills = [object(), object()]
         mock_client._next_order_id = 10
 
         mock_client.clear_orders()
@@ -372,7 +374,7 @@ class TestMockIBKRClientHelpers:
 
     def test_get_mock_price_consistency(self, mock_client):
         """Test mock price generation is consistent for same symbol."""
-        contract = Stock("AAPL", "SMART", "USD")
+        contract = _AAPL
 
         price1 = mock_client._get_mock_price(contract)
         price2 = mock_client._get_mock_price(contract)
@@ -383,8 +385,8 @@ class TestMockIBKRClientHelpers:
 
     def test_get_mock_price_different_symbols(self, mock_client):
         """Test mock prices differ by symbol."""
-        contract_aapl = Stock("AAPL", "SMART", "USD")
-        contract_msft = Stock("MSFT", "SMART", "USD")
+        contract_aapl = _AAPL
+        contract_msft = _MSFT
 
         price_aapl = mock_client._get_mock_price(contract_aapl)
         price_msft = mock_client._get_mock_price(contract_msft)
@@ -396,7 +398,6 @@ class TestMockIBKRClientHelpers:
 class TestMockIBKRClientIntegration:
     """Integration tests for mock IBKR client workflows."""
 
-    @pytest.mark.asyncio
     async def test_complete_order_workflow(self, mock_client):
         """Test complete order lifecycle."""
         # Connect
@@ -404,8 +405,8 @@ class TestMockIBKRClientIntegration:
         assert mock_client.is_connected()
 
         # Place order
-        contract = Stock("AAPL", "SMART", "USD")
-        order = LimitOrder("BUY", 100, 150.0)
+        contract = _AAPL
+        order = copy.copy(_BUY_LIMIT)
         trade = await mock_client.place_order(contract, order)
 
         assert trade.order.orderId == 1
@@ -420,19 +421,20 @@ class TestMockIBKRClientIntegration:
         await mock_client.disconnect()
         assert not mock_client.is_connected()
 
-    @pytest.mark.asyncio
     async def test_multiple_orders_workflow(self, mock_client):
         """Test placing multiple orders."""
         contracts = [
-            Stock("AAPL", "SMART", "USD"),
-            Stock("MSFT", "SMART", "USD"),
-            Stock("GOOGL", "SMART", "USD"),
+            _AAPL,
+            _MSFT,
+            _GOOGL,
         ]
 
-        for i, contract in enumerate(contracts):
-            order = LimitOrder("BUY", 100 * (i + 1), 150.0)
-            trade = await mock_client.place_order(contract, order)
-            assert trade.order.orderId == i + 1
+        # Order IDs are assigned synchronously, so concurrent placement is safe
+        trades = await asyncio.gather(*[
+            mock_client.place_order(contract, LimitOrder("BUY", 100 * (i + 1), 150.0))
+            for i, contract in enumerate(contracts)
+        ])
+        assert sorted(trade.order.orderId for trade in trades) == [1, 2, 3]
 
         placed_orders = mock_client.get_placed_orders()
         assert len(placed_orders) == 3
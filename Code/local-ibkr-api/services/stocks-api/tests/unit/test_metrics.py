@@ -0,0 +1,188 @@
+"""
+Unit tests for Prometheus metrics helpers.
+
+Tests request metric warmup for the application's routes, buffered
+counter increments, and the /metrics scrape endpoint.
+"""
+import asyncio
+from collections import deque
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry, Counter
+from starlette.responses import PlainTextResponse
+
+from app.main import app as api_app
+from app.utils import metrics
+
+
+@pytest.fixture
+def duration_children(monkeypatch):
+    """Give each test an empty duration children table."""
+    children = {}
+    monkeypatch.setattr(metrics, "_duration_children", children)
+    return children
+
+
+@pytest.fixture
+def pending(monkeypatch):
+    """Give each test an empty buffer of pending increments."""
+    buffer = deque()
+    monkeypatch.setattr(metrics, "_pending_increments", buffer)
+    return buffer
+
+
+@pytest.fixture
+def registry():
+    """Create a private registry so counters don't leak between tests."""
+    return CollectorRegistry()
+
+
+@pytest.fixture
+def app():
+    """Create an app with a parametrized API route and a plain route."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/items")
+    async def create_item():
+        return {}
+
+    async def ping(request):
+        return PlainTextResponse("pong")
+
+    # Starlette adds HEAD to plain GET routes implicitly
+    app.add_route("/ping", ping, methods=["GET"])
+    return app
+
+
+class TestWarmupMetrics:
+    """Test pre-creation of request metric children."""
+
+    def test_warms_declared_methods(self, app, duration_children):
+        """Test every declared route method gets a duration child."""
+        metrics.warmup_metrics(app)
+
+        assert ("GET", "/items/{item_id}") in duration_children
+        assert ("POST", "/items") in duration_children
+        assert ("GET", "/ping") in duration_children
+
+    def test_skips_implicit_head(self, app, duration_children):
+        """Test the HEAD method Starlette adds to GET routes is not warmed."""
+        metrics.warmup_metrics(app)
+
+        assert ("HEAD", "/ping") not in duration_children
+
+    def test_requests_reuse_warmed_children(self, app, duration_children):
+        """Test lookups after warmup return the pre-created child."""
+        metrics.warmup_metrics(app)
+        warmed = duration_children[("GET", "/items/{item_id}")]
+
+        assert metrics._duration("GET", "/items/{item_id}") is warmed
+
+    def test_unwarmed_endpoint_created_on_first_use(self, duration_children):
+        """Test an endpoint missing from the table is added on first use."""
+        child = metrics._duration("GET", "unmatched")
+
+        assert duration_children == {("GET", "unmatched"): child}
+
+
+class TestBufferedCounters:
+    """Test buffering and flushing of counter increments."""
+
+    def test_increments_applied_on_flush(self, pending, registry):
+        """Test buffered increments reach the counter only when flushed."""
+        counter = Counter("buffered", "Buffered counter", ["reason"], registry=registry)
+
+        metrics._buffer_inc(counter, "limit")
+        metrics._buffer_inc(counter, "limit")
+        metrics._buffer_inc(counter, "halt")
+
+        assert registry.get_sample_value("buffered_total", {"reason": "limit"}) is None
+        assert len(pending) == 3
+
+        metrics.flush_metrics()
+
+        assert registry.get_sample_value("buffered_total", {"reason": "limit"}) == 2.0
+        assert registry.get_sample_value("buffered_total", {"reason": "halt"}) == 1.0
+        assert not pending
+
+    def test_flush_with_nothing_pending(self, pending):
+        """Test flushing an empty buffer is a no-op."""
+        metrics.flush_metrics()
+
+        assert not pending
+
+    def test_helpers_buffer_increments(self, pending):
+        """Test the business-metric helpers go through the buffer."""
+        metrics.record_order_rejection("test_helpers_buffer")
+
+        assert list(pending) == [
+            (metrics.order_rejections_total, ("test_helpers_buffer",))
+        ]
+
+    def test_get_metrics_flushes_first(self, pending):
+        """Test a scrape includes increments still sitting in the buffer."""
+        metrics.record_risk_breach("test_scrape_flush")
+
+        payload, _ = metrics.get_metrics()
+
+        assert b'limit_type="test_scrape_flush"' in payload
+        assert not pending
+
+    async def test_flush_loop_survives_errors(self, monkeypatch):
+        """Test a failing flush is logged and the loop keeps running."""
+        flush = Mock(side_effect=[RuntimeError("boom"), asyncio.CancelledError()])
+        monkeypatch.setattr(metrics, "flush_metrics", flush)
+
+        with pytest.raises(asyncio.CancelledError):
+            await metrics._flush_loop(0)
+
+        assert flush.call_count == 2
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics scrape endpoint."""
+
+    @pytest.fixture(scope="class")
+    def client(self):
+        """Create a test client without running the app lifespan."""
+        return TestClient(api_app)
+
+    def test_text_format_by_default(self, client):
+        """Test scrapes without an Accept header get the text format."""
+        response = client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert b"# HELP api_requests_total" in response.content
+
+    def test_openmetrics_when_accepted(self, client):
+        """Test scrapers asking for OpenMetrics get it."""
+        response = client.get(
+            "/metrics", headers={"Accept": "application/openmetrics-text"}
+        )
+
+        assert response.headers["content-type"].startswith("application/openmetrics-text")
+        assert response.content.endswith(b"# EOF\n")
+
+    def test_gzip_left_to_middleware(self, client):
+        """Test compression comes from GZipMiddleware, with Vary set."""
+        response = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        # The client decodes the body, so it must be plain exposition text
+        assert b"# HELP api_requests_total" in response.content
+
+    def test_identity_when_gzip_not_accepted(self, client):
+        """Test the payload is sent uncompressed without gzip in Accept-Encoding."""
+        response = client.get("/metrics", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert b"# HELP api_requests_total" in response.content
@@ -3,64 +3,59 @@ Sanity check test - verifies test infrastructure is working.
 
 This test serves as a CI canary and ensures pytest is configured correctly.
 """
+import importlib.util
+import sys
+
 import pytest
 
+_CORE_DEPENDENCIES = ("fastapi", "pydantic", "sqlalchemy", "redis", "structlog")
+
+# Resolved once at collection; find_spec locates packages without importing them
+_PRESENT = frozenset(
+    name for name in _CORE_DEPENDENCIES if importlib.util.find_spec(name)
+)
+
 
 def test_sanity():
     """Basic sanity check - ensures testing framework works."""
     assert 1 + 1 == 2
 
 
-def test_imports():
-    """Verify core dependencies can be imported."""
-    try:
-        import fastapi
-        import pydantic
-        import sqlalchemy
-        import redis
-        import structlog
-        assert True
-    except ImportError as e:
-        pytest.fail(f"Failed to import required dependency: {e}")
+@pytest.mark.parametrize("name", _CORE_DEPENDENCIES)
+def test_imports(name):
+    """Verify core dependencies are installed."""
+    assert name in _PRESENT
 
 
 def test_python_version():
     """Verify Python 3.12+ is being used."""
-    import sys
     assert sys.version_info >= (3, 12), f"Python 3.12+ required, got {sys.version_info}"
 
 
-@pytest.mark.unit
-def test_basic_math():
-    """Test basic assertions work as expected."""
-    assert 2 * 2 == 4
-    assert 10 / 2 == 5.0
-    assert 3 ** 2 == 9
-
-
-@pytest.mark.unit
-def test_string_operations():
-    """Test string operations for sanity."""
-    test_str = "hello world"
-    assert test_str.upper() == "HELLO WORLD"
-    assert "world" in test_str
-    assert test_str.split() == ["hello", "world"]
-
-
-@pytest.mark.unit
-def test_list_operations():
-    """Test list operations for sanity."""
-    test_list = [1, 2, 3, 4, 5]
-    assert len(test_list) == 5
-    assert sum(test_list) == 15
-    assert max(test_list) == 5
+_TEST_STR = "hello world"
+_TEST_LIST = [1, 2, 3, 4, 5]
+_TEST_DICT = {"a": 1, "b": 2, "c": 3}
 
 
 @pytest.mark.unit
-def test_dict_operations():
-    """Test dictionary operations for sanity."""
-    test_dict = {"a": 1, "b": 2, "c": 3}
-    assert len(test_dict) == 3
-    assert test_dict["a"] == 1
-    assert "b" in test_dict
-    assert list(test_dict.keys()) == ["a", "b", "c"]
+@pytest.mark.parametrize(
+    "actual, expected",
+    [
+        pytest.param(2 * 2, 4, id="multiply"),
+        pytest.param(10 / 2, 5.0, id="divide"),
+        pytest.param(3 ** 2, 9, id="power"),
+        pytest.param(_TEST_STR.upper(), "HELLO WORLD", id="str-upper"),
+        pytest.param("world" in _TEST_STR, True, id="str-contains"),
+        pytest.param(_TEST_STR.split(), ["hello", "world"], id="str-split"),
+        pytest.param(len(_TEST_LIST), 5, id="list-len"),
+        pytest.param(sum(_TEST_LIST), 15, id="list-sum"),
+        pytest.param(max(_TEST_LIST), 5, id="list-max"),
+        pytest.param(len(_TEST_DICT), 3, id="dict-len"),
+        pytest.param(_TEST_DICT["a"], 1, id="dict-getitem"),
+        pytest.param("b" in _TEST_DICT, True, id="dict-contains"),
+        pytest.param(list(_TEST_DICT.keys()), ["a", "b", "c"], id="dict-keys"),
+    ],
+)
+def test_sanity_cases(actual, expected):
+    """Basic math, string, list and dict operations behave as expected."""
+    assert actual == expected
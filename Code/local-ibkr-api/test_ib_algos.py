@@ -1,25 +1,37 @@
 """Check available IB algo strategies."""
-from ib_insync import IB, Stock
-
-ib = IB()
-ib.connect('localhost', 4002, clientId=998)
-
-# Get available algo params for different strategies
-strategies = ['Vwap', 'Twap', 'Adaptive']
-
-for strategy in strategies:
-    print(f"\n{strategy} Parameters:")
-    try:
-        params = ib.whatIfOrder(
-            Stock('AAPL', 'SMART', 'USD'),
-            'BUY',
-            100,
-            orderType='LMT',
-            lmtPrice=250,
-            algoStrategy=strategy
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+_STRATEGIES = ('Vwap', 'Twap', 'Adaptive')
+
+
+@pytest.fixture(scope="module")
+def algo_states(ib_client):
+    """What-if results for every strategy, requested concurrently."""
+    from ib_insync import LimitOrder, Stock
+
+    async def probe():
+        # Resolve the contract once rather than inside every what-if request
+        (contract,) = await ib_client.qualifyContractsAsync(Stock('AAPL', 'SMART', 'USD'))
+        return await asyncio.gather(
+            *[
+                ib_client.whatIfOrderAsync(
+                    contract,
+                    LimitOrder('BUY', 100, 250, algoStrategy=strategy),
+                )
+                for strategy in _STRATEGIES
+            ],
+            return_exceptions=True,
         )
-        print(f"  Supported: Yes")
-    except Exception as e:
-        print(f"  Error: {e}")
 
-ib.disconnect()
+    return dict(zip(_STRATEGIES, ib_client.run(probe())))
+
+
+@pytest.mark.parametrize("strategy", _STRATEGIES)
+def test_algo_supported(algo_states, strategy):
+    """What-if an AAPL limit order routed through each algo strategy."""
+    state = algo_states[strategy]
+    assert state is not None and not isinstance(state, Exception), state